@@ -41,6 +41,7 @@ import logging
 import shutil
 import tempfile
 import zipfile
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
@@ -48,6 +49,24 @@ import rarfile
 
 logger = logging.getLogger(__name__)
 
+# Extension -> file type; anything else is identified by its content
+_EXT_TO_TYPE = {
+    ".pdf": "pdf",
+    ".cbz": "cbz",
+    ".cbr": "cbr",
+    ".jpg": "image",
+    ".jpeg": "image",
+    ".png": "image",
+    ".tiff": "image",
+    ".tif": "image",
+    ".bmp": "image",
+    ".gif": "image",
+    ".webp": "image",
+}
+
+# Files whose type had to be sniffed from content, remembered per DocumentProcessor
+_SNIFF_CACHE_SIZE = 1024
+
 # Optional imports - handle gracefully if not available
 try:
     import fitz  # PyMuPDF for PDF processing
@@ -84,6 +103,9 @@ class DocumentProcessor:
         # Temporary directory for extracted images
         self._temp_dir = None
 
+        # Sniffed file types keyed by (path, mtime_ns, size), least recently used first
+        self._sniffed_types: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+
     def is_available(self) -> bool:
         """Check if document processing is available."""
         return self._available
@@ -96,48 +118,58 @@ class DocumentProcessor:
             File type: "pdf", "cbz", "cbr", "image", "unknown"
         """
         file_path = Path(file_path)
-        if not file_path.exists():
+        try:
+            stat = file_path.stat()
+        except OSError:
             return "unknown"
 
-        # Check file extension first
-        suffix = file_path.suffix.lower()
-
-        if suffix == ".pdf":
-            return "pdf"
-        elif suffix == ".cbz":
-            return "cbz"
-        elif suffix == ".cbr":
-            return "cbr"
-        elif suffix in [".jpg", ".jpeg", ".png", ".tiff", ".tif", ".bmp", ".gif", ".webp"]:
-            return "image"
-        else:
-            # Try to detect by content
-            try:
-                with open(file_path, "rb") as f:
-                    header = f.read(8)
+        # A recognised extension is authoritative; only sniff content when it isn't
+        file_type = _EXT_TO_TYPE.get(file_path.suffix.lower())
+        if file_type:
+            return file_type
+
+        # Content sniffing opens the file, so remember the verdict until it changes on disk
+        cache_key = (str(file_path), stat.st_mtime_ns, stat.st_size)
+        cached = self._sniffed_types.get(cache_key)
+        if cached is not None:
+            self._sniffed_types.move_to_end(cache_key)
+            return cached
+
+        file_type = self._sniff_file_type(file_path)
+        self._sniffed_types[cache_key] = file_type
+        if len(self._sniffed_types) > _SNIFF_CACHE_SIZE:
+            self._sniffed_types.popitem(last=False)
+        return file_type
+
+    def _sniff_file_type(self, file_path: Path) -> str:
+        """Detect the file type from magic bytes, falling back to PIL."""
+        # Try to detect by content
+        try:
+            with open(file_path, "rb") as f:
+                header = f.read(8)
 
-                # PDF detection
-                if header.startswith(b"%PDF"):
-                    return "pdf"
+            # PDF detection
+            if header.startswith(b"%PDF"):
+                return "pdf"
 
-                # ZIP detection (CBZ)
-                if header.startswith(b"PK\x03\x04"):
-                    return "cbz"
+            # ZIP detection (CBZ)
+            if header.startswith(b"PK\x03\x04"):
+                return "cbz"
 
-                # RAR detection (CBR) - RAR signature
-                if header.startswith(b"Rar!\x1a\x07"):
-                    return "cbr"
+            # RAR detection (CBR) - RAR signature
+            if header.startswith(b"Rar!\x1a\x07"):
+                return "cbr"
 
-                # Try image detection with PIL
-                if PIL_AVAILABLE:
-                    try:
-                        Image.open(file_path).close()
-                        return "image"
-                    except OSError:
-                        pass
+            # Try image detection with PIL
+            if PIL_AVAILABLE:
+                try:
+                    Image.open(file_path).close()
+                    return "image"
+                except OSError:
+                    pass
 
-            except Exception as e:
-                logger.debug(f"File type detection failed for {file_path}: {e}")
+        except Exception as e:
+            logger.debug(f"File type detection failed for {file_path}: {e}")
 
         return "unknown"
 
@@ -166,29 +198,31 @@ class DocumentProcessor:
         else:
             raise ValueError(f"Unsupported file type: {file_type}")
 
-    def _extract_pdf_images(self, pdf_path: Path, dpi: int = 300, **kwargs) -> list[dict[str, Any]]:
-        """Extract images from PDF file."""
+    def _extract_pdf_images(
+        self, pdf_path: Path, dpi: int = 300, grayscale: bool = False, **kwargs
+    ) -> list[dict[str, Any]]:
+        """Extract images from PDF file, optionally rendered as single-channel grayscale."""
         if not PYMUPDF_AVAILABLE:
             raise ImportError("PyMuPDF not available for PDF processing")
 
         images_info = []
+        # A directory of its own per call: concurrent renders, or PDFs sharing a filename stem,
+        # can't overwrite each other's pages, and the caller can drop this call's pages alone
+        render_dir = Path(tempfile.mkdtemp(prefix=f"{pdf_path.stem}_", dir=self._get_temp_dir()))
 
         try:
             # Open PDF with PyMuPDF
             doc = fitz.open(str(pdf_path))
 
-            # Create temporary directory for extracted images
-            temp_dir = self._get_temp_dir()
-
             for page_num in range(len(doc)):
                 page = doc.load_page(page_num)
 
                 # Convert page to image
-                pix = page.get_pixmap(dpi=dpi)
+                pix = page.get_pixmap(dpi=dpi, colorspace=fitz.csGRAY if grayscale else fitz.csRGB)
 
                 # Save as PNG
-                image_filename = f"pdf_page_{page_num:04d}.png"
-                image_path = temp_dir / image_filename
+                image_filename = f"{pdf_path.stem}_page_{page_num:04d}.png"
+                image_path = render_dir / image_filename
 
                 pix.save(str(image_path))
 
@@ -200,6 +234,7 @@ class DocumentProcessor:
                     "colorspace": pix.colorspace,
                     "source_type": "pdf",
                     "total_pages": len(doc),
+                    "render_dir": str(render_dir),
                 }
 
                 images_info.append({"image_path": str(image_path), "page_number": page_num, "metadata": metadata})
@@ -209,6 +244,7 @@ class DocumentProcessor:
 
         except Exception as e:
             logger.error(f"PDF extraction failed: {e}")
+            shutil.rmtree(render_dir, ignore_errors=True)
             raise
 
         return images_info
@@ -376,13 +412,11 @@ class DocumentProcessor:
 
     def cleanup_temp_files(self):
         """Clean up temporary extracted files."""
-        if self._temp_dir and self._temp_dir.exists():
-            try:
-                shutil.rmtree(self._temp_dir)
-                self._temp_dir = None
-                logger.debug("Cleaned up temporary files")
-            except Exception as e:
-                logger.warning(f"Failed to cleanup temp files: {e}")
+        # Detach first so any extraction that starts now gets a fresh mkdtemp directory
+        temp_dir, self._temp_dir = self._temp_dir, None
+        if temp_dir is not None:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            logger.debug("Cleaned up temporary files")
 
     def __del__(self):
         """Cleanup on destruction."""
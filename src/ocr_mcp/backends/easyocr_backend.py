@@ -30,10 +30,13 @@
 EasyOCR Backend for OCR-MCP
 """
 
+import asyncio
 import logging
 import os
 from typing import Any
 
+from PIL import Image
+
 from ..core.backend_manager import OCRBackend
 from ..core.config import OCRConfig
 
@@ -105,6 +108,11 @@ class EasyOCRBackend(OCRBackend):
             self._available = False
             logger.warning(f"EasyOCR reader initialization failed: {e}")
 
+    async def warmup(self) -> bool:
+        """Create the EasyOCR reader (and download its models) ahead of the first request."""
+        await asyncio.to_thread(self._ensure_initialized)
+        return self._initialized
+
     async def process_image(
         self,
         image_path: str,
@@ -139,39 +147,7 @@ class EasyOCRBackend(OCRBackend):
         try:
             # Perform OCR
             results = self._reader.readtext(image_path)
-
-            # Extract text and confidence scores
-            extracted_text = []
-            confidence_sum = 0.0
-            text_count = 0
-
-            for _bbox, text, confidence in results:
-                extracted_text.append(text)
-                confidence_sum += confidence
-                text_count += 1
-
-            # Combine all text
-            full_text = " ".join(extracted_text)
-            avg_confidence = confidence_sum / text_count if text_count > 0 else 0.0
-
-            return {
-                "success": True,
-                "text": full_text.strip(),
-                "confidence": round(avg_confidence, 3),
-                "backend": "easyocr",
-                "mode": "text",
-                "format": "text",
-                "processing_time": 1.5,
-                "metadata": {
-                    "text_blocks": len(results),
-                    "languages": self.config.easyocr_languages,
-                    "gpu_enabled": True,
-                },
-                "raw_results": [
-                    {"text": text, "confidence": round(confidence, 3), "bbox": bbox}
-                    for (bbox, text, confidence) in results
-                ],
-            }
+            return self._format_results(results)
 
         except Exception as e:
             logger.error(f"EasyOCR processing error: {e}")
@@ -181,6 +157,86 @@ class EasyOCRBackend(OCRBackend):
                 "backend": "easyocr",
             }
 
+    async def process_images(self, image_paths: list[str], mode: str = "text", **kwargs) -> list[dict[str, Any]]:
+        """
+        Process several images in one batched EasyOCR pass.
+
+        The detector runs the whole batch as one tensor, so every image is resized to the
+        largest width and height in the batch; callers should pass similar-sized pages
+        (BackendManager buckets them with group_by_size). Bounding boxes are scaled back
+        to each original image, so they match what ``process_image`` would return.
+
+        Args:
+            image_paths: Paths to image files
+            mode: Processing mode (only "text" supported for EasyOCR)
+
+        Returns:
+            One OCR result per image, in input order
+
+        Raises:
+            RuntimeError: If the reader is unavailable, so the caller can fall back to per-image processing
+        """
+        if not self.is_available():
+            raise RuntimeError("EasyOCR backend not available")
+
+        self._ensure_initialized()
+        if not self._initialized:
+            raise RuntimeError("EasyOCR reader initialization failed")
+
+        def read_batch() -> list[list]:
+            sizes = []
+            for path in image_paths:
+                with Image.open(path) as img:
+                    sizes.append(img.size)
+            width = max(w for w, _ in sizes)
+            height = max(h for _, h in sizes)
+            batch_results = self._reader.readtext_batched(image_paths, n_width=width, n_height=height)
+            # Map boxes from the shared batch frame back onto each original image
+            return [
+                [
+                    ([[round(x * w / width), round(y * h / height)] for x, y in bbox], text, confidence)
+                    for bbox, text, confidence in results
+                ]
+                for (w, h), results in zip(sizes, batch_results, strict=True)
+            ]
+
+        batch_results = await asyncio.to_thread(read_batch)
+        return [self._format_results(results) for results in batch_results]
+
+    def _format_results(self, results: list) -> dict[str, Any]:
+        """Build the OCR response for one image's ``(bbox, text, confidence)`` detections."""
+        # Extract text and confidence scores
+        extracted_text = []
+        confidence_sum = 0.0
+        text_count = 0
+
+        for _bbox, text, confidence in results:
+            extracted_text.append(text)
+            confidence_sum += confidence
+            text_count += 1
+
+        # Combine all text
+        full_text = " ".join(extracted_text)
+        avg_confidence = confidence_sum / text_count if text_count > 0 else 0.0
+
+        return {
+            "success": True,
+            "text": full_text.strip(),
+            "confidence": round(avg_confidence, 3),
+            "backend": "easyocr",
+            "mode": "text",
+            "format": "text",
+            "processing_time": 1.5,
+            "metadata": {
+                "text_blocks": len(results),
+                "languages": self.config.easyocr_languages,
+                "gpu_enabled": True,
+            },
+            "raw_results": [
+                {"text": text, "confidence": round(confidence, 3), "bbox": bbox} for (bbox, text, confidence) in results
+            ],
+        }
+
     def get_capabilities(self) -> dict[str, Any]:
         """Get EasyOCR capabilities."""
         base_capabilities = super().get_capabilities()
@@ -358,7 +358,7 @@ class OlmOCR2Backend(OCRBackend):
                 page_texts.append(text)
                 page_confidences.append(conf)
                 page_times.append(round(time.time() - page_t0, 2))
-                logger.debug(f"Page {i}/{total_pages}: conf={conf:.4f}, {page_times[-1]}s")
+                logger.debug("Page %d/%d: conf=%.4f, %ss", i, total_pages, conf, page_times[-1])
 
             markdown = self._assemble_markdown(page_texts)
             avg_conf = sum(page_confidences) / len(page_confidences) if page_confidences else 0.0
@@ -1,6 +1,7 @@
 import base64
 import io
 import logging
+import time
 from dataclasses import asdict
 from typing import Any
 
@@ -11,6 +12,9 @@ from .wia_scanner import ScannerInfo, ScannerProperties, ScanSettings
 
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between health checks of a bridge that last reported down
+_RECHECK_INTERVAL_SECS = 5.0
+
 
 class BridgeScannerBackend:
     """
@@ -21,9 +25,11 @@ class BridgeScannerBackend:
     def __init__(self, bridge_url: str = "http://host.docker.internal:15002"):
         self.bridge_url = bridge_url.rstrip("/")
         self._available = False
+        self._last_check = 0.0
         self.check_availability()
 
     def check_availability(self):
+        self._last_check = time.monotonic()
         try:
             resp = requests.get(f"{self.bridge_url}/", timeout=2)
             if resp.status_code == 200:
@@ -36,15 +42,9 @@ class BridgeScannerBackend:
             self._available = False
 
     def is_available(self) -> bool:
-        # Check periodically or assume available if it was once?
-        # For now, let's re-check lazy to avoid startup blocking, or just return last state?
-        # Let's do a quick check if we think it's down, otherwise trust it?
-        # Better: just return existing state, but maybe have a refresh method?
-        # Simple approach: actively check on discover is better.
-        # But 'is_available' is called often.
-        # Let's perform a lightweight check here or just return True if configured?
-        # We will try to ping if not previously available.
-        if not self._available:
+        # Called on every scanner request. A down bridge is re-pinged at most every
+        # _RECHECK_INTERVAL_SECS instead of costing each call an HTTP round-trip (up to the 2s timeout).
+        if not self._available and time.monotonic() - self._last_check >= _RECHECK_INTERVAL_SECS:
             self.check_availability()
         return self._available
 
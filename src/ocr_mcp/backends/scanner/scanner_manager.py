@@ -32,7 +32,10 @@ Scanner Manager: Unified interface for multiple scanner backends
 Orchestrates WIA, TWAIN, and other scanner control systems with a unified API.
 """
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
+from dataclasses import replace
 from typing import Any
 
 from .bridge_scanner import BridgeScannerBackend
@@ -40,6 +43,13 @@ from .wia_scanner import ScannerInfo, ScannerProperties, ScanSettings, WIABacken
 
 logger = logging.getLogger(__name__)
 
+# Resolution of preview scans: enough to see placement, a fraction of a full scan's transfer time
+PREVIEW_DPI = 75
+
+# Previews at or below this resolution are scanned 1-bit: an eighth of the grayscale transfer,
+# still enough to see where the page sits on the glass
+PREVIEW_BLACKWHITE_MAX_DPI = 100
+
 
 class ScannerManager:
     """
@@ -91,12 +101,12 @@ class ScannerManager:
                         self._discovered_scanners[unique_id] = scanner
                         all_scanners.append(scanner)
 
-                    logger.info(f"{backend_name.upper()} backend found {len(scanners)} scanners")
+                    logger.info("%s backend found %d scanners", backend_name.upper(), len(scanners))
                 except Exception as e:
                     logger.error(f"Error discovering scanners with {backend_name}: {e}")
 
         self._last_discovery = all_scanners
-        logger.info(f"Total scanners discovered: {len(all_scanners)}")
+        logger.info("Total scanners discovered: %d", len(all_scanners))
         return all_scanners
 
     def get_backend_status(self) -> dict[str, Any]:
@@ -240,6 +250,20 @@ class ScannerManager:
             logger.error(f"Failed to scan document on {device_id}: {e}")
             return None
 
+    def preview_scan(self, device_id: str, dpi: int = PREVIEW_DPI) -> Any | None:
+        """
+        Perform a quick low-resolution scan for positioning the document.
+
+        Args:
+            device_id: Scanner device ID (with backend prefix)
+            dpi: Preview resolution
+
+        Returns:
+            PIL Image object if successful, None otherwise
+        """
+        color_mode = "BlackWhite" if dpi <= PREVIEW_BLACKWHITE_MAX_DPI else "Grayscale"
+        return self.scan_document(device_id, {"dpi": dpi, "color_mode": color_mode})
+
     async def scan_batch(
         self,
         device_id: str,
@@ -259,34 +283,52 @@ class ScannerManager:
         Returns:
             List of PIL Image objects
         """
+        return [image async for image in self.iter_scan_batch(device_id, settings, count)]
+
+    async def iter_scan_batch(self, device_id: str, settings: dict[str, Any], count: int = 10) -> AsyncIterator[Any]:
+        """
+        Scan up to count documents through the ADF, yielding each as soon as it is acquired.
+
+        Each scan runs on a worker thread, so the caller can save one page while the
+        scanner feeds the next. Stops at the first failed page.
+
+        Args:
+            device_id: Scanner device ID (with backend prefix)
+            settings: Dictionary of scan settings
+            count: Maximum number of documents to scan
+
+        Yields:
+            PIL Image objects
+        """
         backend_name, _actual_device_id = self._parse_device_id(device_id)
         backend = self.backends.get(backend_name)
 
         if not backend or not backend.is_available():
-            return []
+            return
 
-        images = []
+        # Configure scanner for batch mode, converting once rather than per page
+        if isinstance(settings, dict):
+            settings = ScanSettings(**settings)
+        batch_settings = replace(settings, use_adf=True)  # Enable ADF for batch scanning
+
+        scanned = 0
         try:
             for i in range(count):
-                logger.info(f"Scanning document {i + 1}/{count}")
-
-                # Configure scanner for batch mode
-                batch_settings = settings.copy()
-                batch_settings["use_adf"] = True  # Enable ADF for batch scanning
+                logger.info("Scanning document %d/%d", i + 1, count)
 
-                image = self.scan_document(device_id, batch_settings)
-                if image:
-                    images.append(image)
-                    logger.info(f"Document {i + 1} scanned successfully")
-                else:
+                image = await asyncio.to_thread(self.scan_document, device_id, batch_settings)
+                if not image:
                     logger.warning(f"Failed to scan document {i + 1}")
                     break  # Stop on first failure
 
+                logger.info("Document %d scanned successfully", i + 1)
+                scanned += 1
+                yield image
+
         except Exception as e:
             logger.error(f"Batch scanning failed on {device_id}: {e}")
 
-        logger.info(f"Batch scanning completed: {len(images)} documents scanned")
-        return images
+        logger.info("Batch scanning completed: %d documents scanned", scanned)
 
     def _parse_device_id(self, device_id: str) -> tuple[str, str]:
         """
@@ -121,7 +121,7 @@ class ScannerInfo:
     max_dpi: int = 600
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanSettings:
     """Scanner configuration settings."""
 
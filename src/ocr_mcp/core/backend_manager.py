@@ -30,6 +30,7 @@
 OCR Backend Manager: Manages multiple OCR backends with unified interface
 """
 
+import asyncio
 import inspect
 import logging
 import tempfile
@@ -39,6 +40,7 @@ from typing import Any
 from PIL import Image, ImageDraw
 
 from .backend_optimizer import BackendOptimizer
+from .batch_queue import AsyncBatchQueue, group_by_size
 from .config import OCRConfig
 from .model_manager import model_manager
 
@@ -61,6 +63,18 @@ except (ImportError, AttributeError):
     document_processor = None
 
 
+def _image_sizes(image_paths: list[str]) -> list[tuple[int, int]]:
+    """(width, height) from each image header without decoding pixels; (0, 0) if unreadable."""
+    sizes = []
+    for path in image_paths:
+        try:
+            with Image.open(path) as img:
+                sizes.append(img.size)
+        except OSError:
+            sizes.append((0, 0))
+    return sizes
+
+
 class MockOCRBackend:
     """Mock backend for failed OCR backends - provides graceful degradation"""
 
@@ -150,6 +164,18 @@ class OCRBackend:
         """Process an image with this backend."""
         raise NotImplementedError("Subclasses must implement process_image")
 
+    async def warmup(self) -> bool:
+        """Load the model ahead of the first request; returns True if one is now loaded.
+
+        Covers backends that load lazily through a synchronous ``_load_model`` into ``_model``,
+        run on a worker thread. Backends with nothing to load return False.
+        """
+        load_model = getattr(self, "_load_model", None)
+        if load_model is None:
+            return False
+        await asyncio.to_thread(load_model)
+        return getattr(self, "_model", None) is not None
+
     def get_capabilities(self) -> dict[str, Any]:
         """Get backend capabilities."""
         return {
@@ -167,6 +193,8 @@ class BackendManager:
     def __init__(self, config: OCRConfig):
         self.config = config
         self.backends: dict[str, OCRBackend | None] = {}  # Allow None for lazy loading
+        # Request collators for batching backends, keyed by (backend name, mode)
+        self._batch_queues: dict[tuple[str, str], AsyncBatchQueue] = {}
         self.scanner_manager = scanner_manager
         self.document_processor = document_processor
 
@@ -401,10 +429,36 @@ class BackendManager:
         logger.warning(f"Requested backend '{requested_backend}' not available, falling back to auto-selection")
         return self.select_backend("auto")
 
+    async def _ensure_model_loaded(self, backend: OCRBackend) -> dict[str, Any] | None:
+        """Load model if needed (for newer backends); returns an error result if loading failed."""
+        if hasattr(backend, "load_model"):
+            if (
+                (hasattr(backend, "model") and backend.model is None)
+                or (hasattr(backend, "ocr") and backend.ocr is None)
+                or (hasattr(backend, "pipeline") and backend.pipeline is None)
+            ):
+                logger.info(f"Automatically loading model/engine for {backend.name}")
+                loaded = await backend.load_model()
+                if loaded is False:
+                    return {
+                        "success": False,
+                        "error": (
+                            f"Model engine failed to load for '{backend.name}'. "
+                            "Check server logs (HF download, disk space, CUDA OOM). "
+                            "Try backend tesseract or pp-ocrv5 for offline scans."
+                        ),
+                        "backend_used": backend.name,
+                    }
+        return None
+
     async def process_with_backend(
         self, backend_name: str, image_path: str, mode: str = "text", **kwargs
     ) -> dict[str, Any]:
-        """Process an image with a specific backend."""
+        """Process an image with a specific backend.
+
+        For backends with batched inference (``process_images``), concurrent plain calls are
+        coalesced through a shared AsyncBatchQueue into one forward pass per batch.
+        """
         backend = self.select_backend(backend_name, image_path)
         if not backend:
             return {
@@ -413,26 +467,16 @@ class BackendManager:
                 "available_backends": self.get_available_backends(),
             }
 
+        if hasattr(backend, "process_images") and all(v is None for v in kwargs.values()):
+            return await self._batch_queue(backend, mode).submit(image_path)
+        return await self._process_single(backend, image_path, mode, **kwargs)
+
+    async def _process_single(self, backend: OCRBackend, image_path: str, mode: str, **kwargs) -> dict[str, Any]:
+        """Run one image through ``backend``, loading its model first if needed."""
         try:
-            # Load model if needed (for newer backends)
-            if hasattr(backend, "load_model"):
-                if (
-                    (hasattr(backend, "model") and backend.model is None)
-                    or (hasattr(backend, "ocr") and backend.ocr is None)
-                    or (hasattr(backend, "pipeline") and backend.pipeline is None)
-                ):
-                    logger.info(f"Automatically loading model/engine for {backend.name}")
-                    loaded = await backend.load_model()
-                    if loaded is False:
-                        return {
-                            "success": False,
-                            "error": (
-                                f"Model engine failed to load for '{backend.name}'. "
-                                "Check server logs (HF download, disk space, CUDA OOM). "
-                                "Try backend tesseract or pp-ocrv5 for offline scans."
-                            ),
-                            "backend_used": backend.name,
-                        }
+            load_error = await self._ensure_model_loaded(backend)
+            if load_error:
+                return load_error
 
             # Call the appropriate processing method
             if hasattr(backend, "process_document"):
@@ -464,6 +508,80 @@ class BackendManager:
                 "backend_used": backend.name,
             }
 
+    async def _process_images(
+        self, backend: OCRBackend, image_paths: list[str], mode: str, **kwargs
+    ) -> list[dict[str, Any]]:
+        """One batched ``process_images`` call; falls back to per-image processing if it fails."""
+        try:
+            load_error = await self._ensure_model_loaded(backend)
+            if load_error:
+                return [dict(load_error) for _ in image_paths]
+            # One call per bucket of similar-sized pages, so the backend pads little within a batch
+            sizes = await asyncio.to_thread(_image_sizes, image_paths)
+            results: list[dict[str, Any]] = [{}] * len(image_paths)
+            for group in group_by_size(sizes):
+                group_results = await backend.process_images([image_paths[i] for i in group], mode=mode, **kwargs)
+                for i, result in zip(group, group_results, strict=True):
+                    result["backend_used"] = backend.name
+                    results[i] = result
+            return results
+        except Exception as e:
+            logger.warning(f"Batched processing with {backend.name} failed, retrying per image: {e}")
+            return [await self._process_single(backend, path, mode, **kwargs) for path in image_paths]
+
+    def _batch_queue(self, backend: OCRBackend, mode: str) -> AsyncBatchQueue:
+        """Shared request collator for a batching backend and OCR mode, created on first use."""
+        key = (backend.name, mode)
+        queue = self._batch_queues.get(key)
+        if queue is None:
+            queue = AsyncBatchQueue(
+                lambda paths: self._process_images(backend, paths, mode),
+                max_batch_size=self.config.batch_size,
+            )
+            self._batch_queues[key] = queue
+        return queue
+
+    async def process_batch_with_backend(
+        self, backend_name: str, image_paths: list[str], mode: str = "text", **kwargs
+    ) -> list[dict[str, Any]]:
+        """Process several images with one backend, one result per image in input order.
+
+        Backends that implement ``process_images(image_paths, mode=..., **kwargs)`` (easyocr) get
+        one batched call per bucket of similar-sized pages instead of one call per page.
+        Everything else (e.g. tesseract) falls back to sequential ``process_with_backend`` calls.
+        """
+        backend = self.select_backend(backend_name, image_paths[0] if image_paths else None)
+        if image_paths and backend is not None and hasattr(backend, "process_images"):
+            return await self._process_images(backend, image_paths, mode, **kwargs)
+
+        return [await self.process_with_backend(backend_name, path, mode, **kwargs) for path in image_paths]
+
+    async def warmup(self, backend_names: list[str]) -> list[str]:
+        """Load models up front so the first request doesn't pay for it; returns backends that warmed up.
+
+        Instances and loaded models stay cached in ``self.backends``, so later calls reuse them.
+        """
+        warmed = []
+        for name in backend_names:
+            backend = self.get_backend(canonical_backend_name(name))
+            if not backend or not backend.is_available():
+                logger.info(f"Skipping warm-up for unavailable backend {name}")
+                continue
+            try:
+                if hasattr(backend, "load_model"):
+                    loaded = await self._ensure_model_loaded(backend) is None
+                else:
+                    warmup = getattr(backend, "warmup", None)
+                    loaded = bool(warmup and await warmup())
+                if loaded:
+                    warmed.append(backend.name)
+                else:
+                    logger.info(f"Nothing to warm up for backend {name}")
+            except Exception as e:
+                logger.warning(f"Warm-up failed for {name}: {e}")
+        logger.info(f"Warmed up backends: {warmed}")
+        return warmed
+
     def list_backends(self) -> dict[str, Any]:
         """List all registered backends with availability and capabilities.
 
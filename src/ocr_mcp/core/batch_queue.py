@@ -0,0 +1,128 @@
+# MIT License
+#
+# Copyright (c) 2025 OCR-MCP Project
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+#
+#
+#
+#
+
+"""
+OCR-MCP Batch Queue: coalesces concurrent single-image requests into batched backend calls
+
+Requests wait at most ``max_wait_time`` for companions; a full batch is dispatched immediately.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def group_by_size(sizes: list[tuple[int, int]], size_threshold: float = 0.2) -> list[list[int]]:
+    """Bucket image indices so each bucket's widths, and its heights, are within ``size_threshold`` of its largest.
+
+    Batched detectors resize or pad every image to the batch's largest width and height; bounding
+    both dimensions (not just area, which a portrait and a landscape page can share) keeps that
+    distortion small. Buckets are returned largest first, indices ascending.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: sizes[i][0] * sizes[i][1], reverse=True)
+    groups: list[list[int]] = []
+    # Per bucket: [min width, max width, min height, max height]
+    bounds: list[list[int]] = []
+    keep = 1 - size_threshold
+    for i in order:
+        w, h = sizes[i]
+        for g, (min_w, max_w, min_h, max_h) in enumerate(bounds):
+            widened = [min(min_w, w), max(max_w, w), min(min_h, h), max(max_h, h)]
+            if widened[0] >= widened[1] * keep and widened[2] >= widened[3] * keep:
+                groups[g].append(i)
+                bounds[g] = widened
+                break
+        else:
+            groups.append([i])
+            bounds.append([w, w, h, h])
+    return [sorted(group) for group in groups]
+
+
+class AsyncBatchQueue:
+    """Collects items submitted concurrently and hands them to ``process_fn`` as one list.
+
+    ``process_fn`` must return one result per item, in order. No background loop runs while
+    the queue is idle: the first pending item arms a flush timer, a full batch flushes at once.
+    """
+
+    def __init__(
+        self,
+        process_fn: Callable[[list[Any]], Awaitable[list[Any]]],
+        max_batch_size: int = 8,
+        max_wait_time: float = 0.05,
+    ):
+        self.process_fn = process_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_time = max_wait_time
+        self._pending: list[tuple[Any, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, item: Any) -> Any:
+        """Queue ``item`` and wait for its result from the batch it lands in."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_time, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[Any, asyncio.Future]]) -> None:
+        try:
+            results = await self.process_fn([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(f"Batch returned {len(results)} results for {len(batch)} items")
+        except Exception as e:
+            logger.error(f"Batch of {len(batch)} failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results, strict=True):
+            # A submitter that was cancelled no longer wants its result
+            if not future.done():
+                future.set_result(result)
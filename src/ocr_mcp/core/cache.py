@@ -0,0 +1,150 @@
+# MIT License
+#
+# Copyright (c) 2025 OCR-MCP Project
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+#
+#
+#
+#
+
+"""
+OCR-MCP Analysis Cache: memoizes image analyses by file content
+
+Layout and quality analyses are pure functions of the image bytes and their flags, so an
+agent that re-queries the same page (analyze_layout, then extract_tables, ...) reuses them.
+"""
+
+import asyncio
+import copy
+import functools
+import hashlib
+import inspect
+import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Injected dependencies never affect an analysis result
+_UNKEYED_PARAMS = frozenset({"backend_manager", "config"})
+
+
+def file_digest(path: str) -> str:
+    """Content hash used to recognise an image that was already processed."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list | tuple | set | frozenset):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class AnalysisCache:
+    """LRU + TTL cache of successful analysis results keyed by (content digest, path, op, flags)."""
+
+    def __init__(self, max_entries: int = 512, ttl_secs: float = 3600):
+        self.max_entries = max_entries
+        self.ttl_secs = ttl_secs
+        self._entries: OrderedDict[tuple, tuple[float, dict[str, Any]]] = OrderedDict()
+        # Digests by (path, mtime_ns, size), so an unchanged file is only hashed once
+        self._digests: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+
+    async def digest(self, path: str) -> str:
+        stat = os.stat(path)
+        stat_key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+        digest = self._digests.get(stat_key)
+        if digest is None:
+            digest = await asyncio.to_thread(file_digest, path)
+            self._digests[stat_key] = digest
+            if len(self._digests) > self.max_entries:
+                self._digests.popitem(last=False)
+        return digest
+
+    def get(self, key: tuple) -> dict[str, Any] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > self.ttl_secs:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(result)
+
+    def put(self, key: tuple, result: dict[str, Any]) -> None:
+        self._entries[key] = (time.monotonic(), copy.deepcopy(result))
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._digests.clear()
+
+    def memoize(self, op_name: str) -> Callable:
+        """Cache an async analysis whose first parameter is the image path.
+
+        Only successful results are stored; a missing or unreadable file bypasses the cache
+        so the wrapped function reports the error itself.
+        """
+
+        def decorator(func: Callable[..., Awaitable[dict[str, Any]]]):
+            signature = inspect.signature(func)
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                params = dict(bound.arguments)
+                image_path = params.pop(next(iter(signature.parameters)))
+                try:
+                    digest = await self.digest(image_path)
+                except (OSError, TypeError):
+                    return await func(*args, **kwargs)
+
+                flags = _freeze({k: v for k, v in params.items() if k not in _UNKEYED_PARAMS})
+                # Results echo the path back, so a byte-identical copy elsewhere gets its own entry
+                key = (digest, os.path.abspath(image_path), op_name, flags)
+                cached = self.get(key)
+                if cached is not None:
+                    logger.debug("%s cache hit for %s", op_name, image_path)
+                    return cached
+
+                result = await func(*args, **kwargs)
+                if result.get("success", False):
+                    self.put(key, result)
+                return result
+
+            return wrapper
+
+        return decorator
+
+
+# Shared by the analysis tools
+analysis_cache = AnalysisCache()
@@ -57,6 +57,8 @@ class OCRConfig(BaseModel):
 
     # Default backend settings
     default_backend: str = Field(default="auto")  # "auto", "got-ocr", "tesseract", etc.
+    # Backends whose models are loaded in the background at server startup
+    warmup_backends: list[str] = Field(default_factory=list)
 
     # Processing settings
     batch_size: int = Field(default=4)
@@ -104,6 +106,10 @@ class OCRConfig(BaseModel):
             float(os.getenv("OCR_MAX_MEMORY", 0)) if os.getenv("OCR_MAX_MEMORY") else None,
         )
         data.setdefault("default_backend", os.getenv("OCR_DEFAULT_BACKEND", "auto"))
+        data.setdefault(
+            "warmup_backends",
+            [b.strip() for b in os.getenv("OCR_WARMUP_BACKENDS", "").split(",") if b.strip()],
+        )
         data.setdefault("batch_size", int(os.getenv("OCR_BATCH_SIZE", 4)))
         data.setdefault("max_concurrent_jobs", int(os.getenv("OCR_MAX_CONCURRENT", 4)))
         data.setdefault("mistral_api_key", os.getenv("MISTRAL_API_KEY"))
@@ -40,6 +40,7 @@ Features:
   via sampling with tools.
 """
 
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -88,8 +89,14 @@ async def server_lifespan(mcp_instance: FastMCP):
         available_backends = bm.get_available_backends()
         logger.info("OCR-MCP initialized with backends: %s", available_backends)
 
+        # Load configured models in the background so startup isn't held up by them
+        warmup_task = asyncio.create_task(bm.warmup(config.warmup_backends)) if config.warmup_backends else None
+
         yield  # Server runs here
 
+        if warmup_task and not warmup_task.done():
+            warmup_task.cancel()
+
     except Exception as e:
         logger.error("Failed to initialize OCR backends: %s", e)
         raise
@@ -35,9 +35,12 @@ and document structure understanding.
 
 import logging
 import re
+from collections import Counter
+from itertools import islice
 from typing import Any
 
 from ..core.backend_manager import BackendManager
+from ..core.cache import analysis_cache
 from ..core.config import OCRConfig
 
 # Optional OpenCV import
@@ -51,7 +54,76 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
-
+# Metadata extraction patterns, compiled once at import time
+_DATE_RE = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in (
+            r"\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b",  # MM/DD/YYYY or DD/MM/YYYY
+            r"\b\d{4}[/-]\d{1,2}[/-]\d{1,2}\b",  # YYYY/MM/DD
+            r"\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+\d{1,2},?\s+\d{2,4}\b",  # Month DD, YYYY
+            r"\b\d{1,2}\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+\d{2,4}\b",  # DD Month YYYY
+        )
+    ),
+    re.IGNORECASE,
+)
+_NAME_RE = re.compile(r"\b[A-Z][a-z]{2,}\b")
+_COMMON_WORDS = frozenset(
+    {
+        "The",
+        "And",
+        "For",
+        "Are",
+        "But",
+        "Not",
+        "You",
+        "All",
+        "Can",
+        "Had",
+        "Her",
+        "Was",
+        "One",
+        "Our",
+        "Out",
+        "Day",
+        "Get",
+        "Has",
+        "Him",
+        "His",
+        "How",
+        "Its",
+        "May",
+        "New",
+        "Now",
+        "Old",
+        "See",
+        "Two",
+        "Way",
+        "Who",
+        "Boy",
+        "Did",
+        "Let",
+        "Put",
+        "Say",
+        "She",
+        "Too",
+        "Use",
+    }
+)
+# Document numbers ("INV-123", "PO#456"), monetary amounts ($123.45, 123.45 USD) and 3+ digit numbers
+_NUMBERS_RE = re.compile(
+    r"(?P<doc>\b(?:INV|PO|ORD|REF|DOC)[\s#-]*\d+\b)"
+    r"|(?P<amt>\b(?:\$|€|£|¥)\s*\d+(?:\.\d{2})?\b|\b\d+(?:\.\d{2})?\s*(?:USD|EUR|GBP|JPY|dollars?|euros?|pounds?)\b)"
+    r"|(?P<num>\b\d{3,}\b)",
+    re.IGNORECASE,
+)
+_ADDRESS_RE = re.compile(
+    r"^[^\S\n]*(?=[^\n]*\b(?:street|avenue|road|drive|lane|way|place|court)\b)(\S[^\n]{9,}\S)[^\S\n]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+@analysis_cache.memoize("analyze_layout")
 async def analyze_document_layout(
     image_path: str,
     analysis_type: str = "comprehensive",
@@ -1068,113 +1140,35 @@ def _classify_document_type(text, layout_analysis):
 
 def _extract_dates(text):
     """Extract date patterns from text."""
-    # Common date patterns
-    date_patterns = [
-        r"\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b",  # MM/DD/YYYY or DD/MM/YYYY
-        r"\b\d{4}[/-]\d{1,2}[/-]\d{1,2}\b",  # YYYY/MM/DD
-        r"\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+\d{1,2},?\s+\d{2,4}\b",  # Month DD, YYYY
-        r"\b\d{1,2}\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+\d{2,4}\b",  # DD Month YYYY
-    ]
-
-    dates = []
-    for pattern in date_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        dates.extend(matches)
+    # Single pass over the text; every alternative is non-capturing so findall yields whole matches
+    dates = _DATE_RE.findall(text)
 
-    return list(set(dates))  # Remove duplicates
+    return list(dict.fromkeys(dates))  # Remove duplicates, keep document order
 
 
 def _extract_names(text):
     """Extract potential names from text."""
-    # Simple name extraction - capitalized words
-    words = re.findall(r"\b[A-Z][a-z]+\b", text)
-    # Filter out common non-names
-    common_words = {
-        "The",
-        "And",
-        "For",
-        "Are",
-        "But",
-        "Not",
-        "You",
-        "All",
-        "Can",
-        "Had",
-        "Her",
-        "Was",
-        "One",
-        "Our",
-        "Out",
-        "Day",
-        "Get",
-        "Has",
-        "Him",
-        "His",
-        "How",
-        "Its",
-        "May",
-        "New",
-        "Now",
-        "Old",
-        "See",
-        "Two",
-        "Way",
-        "Who",
-        "Boy",
-        "Did",
-        "Let",
-        "Put",
-        "Say",
-        "She",
-        "Too",
-        "Use",
-    }
-    names = [word for word in words if word not in common_words and len(word) > 2]
-    return list(set(names))[:10]  # Limit to 10 most common
+    # Simple name extraction - capitalized words of 3+ letters, minus common non-names
+    counts = Counter(word for word in _NAME_RE.findall(text) if word not in _COMMON_WORDS)
+    return [word for word, _ in counts.most_common(10)]  # Limit to 10 most common
 
 
 def _extract_numbers_and_amounts(text):
     """Extract numbers and monetary amounts."""
-    # Document numbers (patterns like "INV-123", "PO#456")
-    doc_numbers = re.findall(r"\b(?:INV|PO|ORD|REF|DOC)[\s#-]*\d+\b", text, re.IGNORECASE)
-
-    # Monetary amounts ($123.45, €99.99, 123.45 USD)
-    amounts = re.findall(
-        r"\b(?:\$|€|£|¥)\s*\d+(?:\.\d{2})?\b|\b\d+(?:\.\d{2})?\s*(?:USD|EUR|GBP|JPY|dollars?|euros?|pounds?)\b",
-        text,
-        re.IGNORECASE,
-    )
-
-    # General numbers
-    numbers = re.findall(r"\b\d{3,}\b", text)  # Numbers with 3+ digits
+    # One pass; each match lands in the category of the alternative that matched
+    found = {"doc": [], "amt": [], "num": []}
+    for match in _NUMBERS_RE.finditer(text):
+        found[match.lastgroup].append(match.group())
 
     return {
-        "document_numbers": list(set(doc_numbers)),
-        "amounts": list(set(amounts)),
-        "numbers": list(set(numbers))[:20],  # Limit large numbers
+        "document_numbers": list(dict.fromkeys(found["doc"])),
+        "amounts": list(dict.fromkeys(found["amt"])),
+        "numbers": list(islice(dict.fromkeys(found["num"]), 20)),  # Limit large numbers
     }
 
 
 def _extract_addresses(text):
     """Extract potential addresses from text."""
-    # Simple address pattern matching
-    address_indicators = [
-        "street",
-        "avenue",
-        "road",
-        "drive",
-        "lane",
-        "way",
-        "place",
-        "court",
-    ]
-    lines = text.split("\n")
-
-    addresses = []
-    for line in lines:
-        line_lower = line.lower().strip()
-        if any(indicator in line_lower for indicator in address_indicators):
-            if len(line.strip()) > 10:  # Reasonable address length
-                addresses.append(line.strip())
-
-    return addresses[:5]  # Limit to 5 addresses
+    # Simple address pattern matching: stripped lines over 10 chars containing a street indicator
+    # Stop the scan once 5 addresses are found instead of matching the whole document
+    return [match.group(1) for match in islice(_ADDRESS_RE.finditer(text), 5)]
@@ -30,17 +30,113 @@
 Document Format Conversion Helpers for OCR-MCP
 """
 
+import asyncio
+import copy
 import logging
 import os
+import shutil
+import subprocess
+import tempfile
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
 from ..core.backend_manager import BackendManager
+from ..core.cache import file_digest
 from ..core.config import OCRConfig
 from ..core.error_handler import ErrorHandler
 
 logger = logging.getLogger(__name__)
 
+# Source suffix -> PIL format, so Image.open can skip probing every registered plugin
+_PIL_FORMATS_BY_SUFFIX = {
+    ".jpg": ("JPEG",),
+    ".jpeg": ("JPEG",),
+    ".png": ("PNG",),
+    ".tif": ("TIFF",),
+    ".tiff": ("TIFF",),
+    ".bmp": ("BMP",),
+    ".gif": ("GIF",),
+    ".webp": ("WEBP",),
+}
+
+# Characters per line in the invisible searchable-PDF text layer
+_TEXT_LAYER_WIDTH = 80
+
+# Successful OCR results keyed by (content digest, backend, mode), least recently used first
+_OCR_RESULT_CACHE: OrderedDict[tuple[str, str, str], dict[str, Any]] = OrderedDict()
+_OCR_RESULT_CACHE_SIZE = 256
+
+# Rendered page files keyed by (PDF digest, dpi, format, first_page, last_page), each with the
+# (mtime_ns, size) it was written with so an edited or deleted page invalidates the entry
+_PDF_RENDER_CACHE: OrderedDict[tuple, list[tuple[str, int, int]]] = OrderedDict()
+_PDF_RENDER_CACHE_SIZE = 64
+
+
+def _open_image(path: str):
+    """Open an image, trying the format implied by its suffix before full autodetection."""
+    from PIL import Image, UnidentifiedImageError
+
+    formats = _PIL_FORMATS_BY_SUFFIX.get(Path(path).suffix.lower())
+    if formats:
+        try:
+            return Image.open(path, formats=formats)
+        except UnidentifiedImageError:
+            pass  # Misleading extension; let PIL probe
+    return Image.open(path)
+
+
+def _reuse_rendered_pages(pages: list[tuple[str, int, int]], output_directory: str) -> list[str] | None:
+    """Place previously rendered pages in output_directory, or None if any has changed since."""
+    for path, mtime_ns, size in pages:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if (st.st_mtime_ns, st.st_size) != (mtime_ns, size):
+            return None
+
+    saved_files = []
+    for path, _, _ in pages:
+        out_file = os.path.join(output_directory, os.path.basename(path))
+        if not os.path.exists(out_file) or not os.path.samefile(path, out_file):
+            try:
+                os.link(path, out_file)
+            except OSError:
+                shutil.copyfile(path, out_file)
+        saved_files.append(out_file)
+    return saved_files
+
+
+def _jpegtran_optimize(path: str) -> bool:
+    """Losslessly recompress a JPEG in place with jpegtran (mozjpeg/libjpeg-turbo) when installed.
+
+    Keeps Pillow's output if jpegtran is missing, fails, or doesn't make the file smaller.
+    """
+    jpegtran = shutil.which("jpegtran")
+    if not jpegtran:
+        return False
+
+    fd, tmp_path = tempfile.mkstemp(suffix=".jpg", dir=os.path.dirname(os.path.abspath(path)))
+    os.close(fd)
+    try:
+        r = subprocess.run(
+            [jpegtran, "-optimize", "-progressive", "-copy", "none", "-outfile", tmp_path, path],
+            capture_output=True,
+            timeout=60,
+            check=False,
+        )
+        if r.returncode == 0 and 0 < os.path.getsize(tmp_path) < os.path.getsize(path):
+            os.replace(tmp_path, path)
+            return True
+        logger.debug("jpegtran exit %s for %s", r.returncode, path)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.debug("jpegtran: %s", e)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+    return False
+
 
 async def convert_image(
     source_path: str,
@@ -67,7 +163,7 @@ async def convert_image(
             p = Path(source_path)
             target_path = str(p.with_suffix(f".{format.lower()}"))
 
-        img = Image.open(source_path)
+        img = _open_image(source_path)
 
         # Handle transparency if converting to JPEG
         if format.upper() in ["JPG", "JPEG"] and img.mode in ("RGBA", "LA"):
@@ -81,12 +177,17 @@ async def convert_image(
         if format.upper() in ["JPG", "JPEG", "WEBP"]:
             save_kwargs["quality"] = quality
             save_kwargs["optimize"] = optimize
+        if format.upper() in ["JPG", "JPEG"] and optimize:
+            save_kwargs["progressive"] = True
 
         if dpi:
             save_kwargs["dpi"] = (dpi, dpi)
 
         img.save(target_path, **save_kwargs)
 
+        if format.upper() in ["JPG", "JPEG"] and optimize:
+            await asyncio.to_thread(_jpegtran_optimize, target_path)
+
         return {
             "success": True,
             "source_path": source_path,
@@ -122,26 +223,54 @@ async def convert_pdf_to_images(
 
         os.makedirs(output_directory, exist_ok=True)
 
+        # Same bytes at the same settings render the same pages; link them instead of re-rasterizing
+        key = (await asyncio.to_thread(file_digest, pdf_path), dpi, format.upper(), first_page, last_page)
+        cached = _PDF_RENDER_CACHE.get(key)
+        if cached is not None:
+            saved_files = await asyncio.to_thread(_reuse_rendered_pages, cached, output_directory)
+            if saved_files is not None:
+                _PDF_RENDER_CACHE.move_to_end(key)
+                return {
+                    "success": True,
+                    "pdf_path": pdf_path,
+                    "output_directory": output_directory,
+                    "files_created": len(saved_files),
+                    "files": saved_files,
+                    "cached": True,
+                }
+            del _PDF_RENDER_CACHE[key]
+
         poppler_path = None
         if config and getattr(config, "poppler_path", None):
             poppler_path = config.poppler_path
 
-        images = convert_from_path(
+        # Poppler writes each page straight to disk; no PIL images are held in memory.
+        # thread_count splits the page range across that many pdftoppm processes; waiting
+        # on them happens off the event loop so other requests keep being served.
+        rendered_paths = await asyncio.to_thread(
+            convert_from_path,
             pdf_path,
             dpi=dpi,
             first_page=first_page,
             last_page=last_page,
             fmt=format.lower(),
             poppler_path=poppler_path,
+            thread_count=min(os.cpu_count() or 1, 8),
+            output_folder=output_directory,
+            paths_only=True,
         )
 
         saved_files = []
-        for i, img in enumerate(images):
+        for i, rendered_path in enumerate(rendered_paths):
             page_num = (first_page or 1) + i
             out_file = os.path.join(output_directory, f"page_{page_num:03d}.{format.lower()}")
-            img.save(out_file, format.upper())
+            os.replace(rendered_path, out_file)
             saved_files.append(out_file)
 
+        _PDF_RENDER_CACHE[key] = [(f, (st := os.stat(f)).st_mtime_ns, st.st_size) for f in saved_files]
+        if len(_PDF_RENDER_CACHE) > _PDF_RENDER_CACHE_SIZE:
+            _PDF_RENDER_CACHE.popitem(last=False)
+
         return {
             "success": True,
             "pdf_path": pdf_path,
@@ -153,6 +282,61 @@ async def convert_pdf_to_images(
         return ErrorHandler.handle_exception(e, context=f"pdf_to_images_{pdf_path}")
 
 
+async def _ocr_with_cache(
+    backend_manager: BackendManager, backend: str, image_path: str, mode: str = "text"
+) -> dict[str, Any]:
+    """Run OCR through the backend manager, reusing the result for byte-identical images.
+
+    Cached results are copied in and out, so a caller editing its result can't alter later hits.
+    """
+    key = (await asyncio.to_thread(file_digest, image_path), backend, mode)
+    cached = _OCR_RESULT_CACHE.get(key)
+    if cached is not None:
+        _OCR_RESULT_CACHE.move_to_end(key)
+        return copy.deepcopy(cached)
+
+    result = await backend_manager.process_with_backend(backend_name=backend, image_path=image_path, mode=mode)
+    if result.get("success", False):
+        _OCR_RESULT_CACHE[key] = copy.deepcopy(result)
+        if len(_OCR_RESULT_CACHE) > _OCR_RESULT_CACHE_SIZE:
+            _OCR_RESULT_CACHE.popitem(last=False)
+    return result
+
+
+def _build_searchable_pdf(
+    pixmap,
+    ocr_text: str,
+    output_path: str,
+    title: str | None,
+    include_original_image: bool,
+) -> None:
+    """Write a one-page PDF: the scan as the page image, OCR text as an invisible layer."""
+    import fitz
+
+    doc = fitz.open()
+    try:
+        page = doc.new_page(width=pixmap.width, height=pixmap.height)
+        if include_original_image:
+            page.insert_image(page.rect, pixmap=pixmap)
+
+        # Render mode 3 = invisible; the text only needs to be selectable and searchable
+        # OCR output is already line-broken; only overlong lines are cut, at a fixed stride
+        lines = [
+            line[i : i + _TEXT_LAYER_WIDTH]
+            for line in ocr_text.splitlines()
+            if line.strip()
+            for i in range(0, len(line), _TEXT_LAYER_WIDTH)
+        ]
+        if lines:
+            fontsize = max(1.0, min(10.0, page.rect.height / (len(lines) + 1) / 1.2))
+            page.insert_text((0, fontsize), lines, fontsize=fontsize, render_mode=3)
+
+        doc.set_metadata({"title": title or Path(output_path).stem, "producer": "ocr-mcp"})
+        doc.save(output_path, deflate=True)
+    finally:
+        doc.close()
+
+
 async def embed_ocr_text(
     image_path: str,
     output_path: str,
@@ -165,12 +349,41 @@ async def embed_ocr_text(
     """
     Create a searchable PDF by embedding OCR text.
     """
-    # This would involve calling an OCR backend and then using something like reportlab or pikepdf
-    # For now, let's keep it as a placeholder that calls the backend manager
+    logger.info(f"Embedding OCR text layer for {image_path}")
+
     if not backend_manager:
         return ErrorHandler.create_error("INTERNAL_ERROR", "Backend manager missing").to_dict()
 
-    return {
-        "success": True,
-        "message": "Searchable PDF embedding not yet fully implemented",
-    }
+    try:
+        import fitz
+
+        if not os.path.exists(image_path):
+            return ErrorHandler.create_error("FILE_NOT_FOUND", f"File not found: {image_path}").to_dict()
+
+        if ocr_backend == "auto":
+            ocr_backend = config.default_backend if config else "tesseract"
+
+        # Decode the page image while the (much slower) OCR pass runs
+        ocr_result, pixmap = await asyncio.gather(
+            _ocr_with_cache(backend_manager, ocr_backend, image_path),
+            asyncio.to_thread(fitz.Pixmap, image_path),
+        )
+
+        if not ocr_result.get("success", False):
+            return ErrorHandler.create_error("OCR_FAILED", ocr_result.get("error")).to_dict()
+
+        ocr_text = ocr_result.get("text", "")
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        await asyncio.to_thread(_build_searchable_pdf, pixmap, ocr_text, output_path, title, include_original_image)
+
+        return {
+            "success": True,
+            "image_path": image_path,
+            "output_path": output_path,
+            "backend_used": ocr_result.get("backend_used", ocr_backend),
+            "text_length": len(ocr_text),
+            "size_bytes": os.path.getsize(output_path),
+            "message": f"Searchable PDF written to {output_path}",
+        }
+    except Exception as e:
+        return ErrorHandler.handle_exception(e, context=f"embed_ocr_text_{image_path}")
@@ -33,15 +33,38 @@ Image Management Helpers for OCR-MCP Server
 import logging
 import os
 import tempfile
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
 from ..core.backend_manager import BackendManager
 from ..core.config import OCRConfig
 from ..core.error_handler import ErrorHandler
+from ._quality import _estimate_skew
+
+# Optional OpenCV import
+try:
+    import cv2
+    import numpy as np
+
+    OPENCV_AVAILABLE = True
+except ImportError:
+    cv2 = None
+    np = None
+    OPENCV_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Decoded ndarrays keyed by (abspath, mtime_ns, size); capped by entry count and total bytes
+_DECODE_CACHE: OrderedDict[tuple[str, int, int], Any] = OrderedDict()
+_DECODE_CACHE_SIZE = 8
+_DECODE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+_LOSSLESS_EXTS = (".png", ".tiff", ".tif", ".bmp")
+
+# Gray level below which a pixel counts as content when autocropping: scanned paper sits around
+# 240-250 with speckle, so anything near white is background, not just pure 255
+_CONTENT_MAX_GRAY = 200
+
 
 async def preprocess_image(
     source_path: str,
@@ -92,10 +115,18 @@ async def preprocess_image(
         if denoise:
             img = img.filter(ImageFilter.MedianFilter(size=3))
 
+        # Deskew (and autocrop) as one warpAffine, before thresholding so interpolation sees gray levels
+        deskew_angle = None
+        if deskew and OPENCV_AVAILABLE:
+            if img.mode not in ("L", "RGB", "RGBA"):
+                img = img.convert("RGB")
+            arr, deskew_angle = _deskew_and_crop(np.asarray(img), crop=autocrop)
+            img = Image.fromarray(arr)
+
         if threshold:
             img = img.point(lambda p: p > 128 and 255)
 
-        if autocrop:
+        if autocrop and deskew_angle is None:
             # Simple autocrop using bounding box of non-white pixels
             # Invert if it's grayscale to find content
             if img.mode == "L":
@@ -138,6 +169,8 @@ async def preprocess_image(
         if threshold:
             operations_applied.append("Applied thresholding for binary image conversion")
             recommendations.append("Thresholding enhances character recognition in high-contrast scenarios")
+        if deskew_angle:
+            operations_applied.append(f"Corrected {deskew_angle:.2f} degree skew")
         if autocrop:
             operations_applied.append("Applied automatic cropping to focus on content")
             recommendations.append("Cropping reduces processing time and improves focus")
@@ -169,7 +202,7 @@ async def preprocess_image(
             "applied_operations": {
                 "grayscale": grayscale,
                 "denoise": denoise,
-                "deskew": deskew,
+                "deskew": deskew_angle is not None,
                 "threshold": threshold,
                 "autocrop": autocrop,
             },
@@ -194,15 +227,214 @@ async def preprocess_image(
         return ErrorHandler.handle_exception(e, context=f"preprocess_image_{source_path}")
 
 
+def _decode_cache_key(image_path: str) -> tuple[str, int, int]:
+    stat = os.stat(image_path)
+    return (os.path.abspath(image_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _cache_decoded(key: tuple[str, int, int], img) -> None:
+    """Insert into the decode cache, evicting least recently used entries past the entry/byte caps."""
+    _DECODE_CACHE[key] = img
+    _DECODE_CACHE.move_to_end(key)
+    while len(_DECODE_CACHE) > 1 and (
+        len(_DECODE_CACHE) > _DECODE_CACHE_SIZE
+        or sum(cached.nbytes for cached in _DECODE_CACHE.values()) > _DECODE_CACHE_MAX_BYTES
+    ):
+        _DECODE_CACHE.popitem(last=False)
+
+
+def _read_cv_image(image_path: str):
+    """Decode an image into a BGR/grayscale ndarray (imdecode also copes with non-ASCII Windows paths).
+
+    Decodes are cached by (path, mtime, size), so chained deskew/rotate steps don't re-decode
+    the same page. The returned array may be shared; callers must not modify it in place.
+    """
+    key = _decode_cache_key(image_path)
+    img = _DECODE_CACHE.get(key)
+    if img is not None:
+        _DECODE_CACHE.move_to_end(key)
+        return img
+
+    img = cv2.imdecode(np.fromfile(image_path, dtype=np.uint8), cv2.IMREAD_UNCHANGED)
+    if img is None:
+        raise ValueError(f"Could not decode image: {image_path}")
+    _cache_decoded(key, img)
+    return img
+
+
+def _write_cv_image(img, source_path: str, prefix: str) -> str:
+    """Encode an ndarray to a new temp file, keeping the source extension where OpenCV can write it."""
+    ext = Path(source_path).suffix.lower()
+    if ext not in (".png", ".jpg", ".jpeg", ".tiff", ".tif", ".bmp"):
+        ext = ".png"
+    # These are pipeline intermediates read back once, so favour encode speed over file size
+    params = [cv2.IMWRITE_PNG_COMPRESSION, 1] if ext == ".png" else []
+    ok, buf = cv2.imencode(ext, img, params)
+    if not ok:
+        raise ValueError(f"Could not encode image as {ext}")
+    fd, target_path = tempfile.mkstemp(suffix=ext, prefix=prefix)
+    with os.fdopen(fd, "wb") as f:
+        f.write(buf.tobytes())
+    # Lossless output decodes back to exactly ``img``, so the next pipeline step can skip the decode
+    if ext in _LOSSLESS_EXTS:
+        _cache_decoded(_decode_cache_key(target_path), img)
+    return target_path
+
+
+def _rotation_matrix(w: int, h: int, angle: float):
+    """Affine matrix rotating a w x h image by ``angle`` degrees onto a canvas big enough to hold it."""
+    matrix = cv2.getRotationMatrix2D((w / 2, h / 2), angle, 1.0)
+    cos, sin = abs(matrix[0, 0]), abs(matrix[0, 1])
+    new_w, new_h = int(h * sin + w * cos), int(h * cos + w * sin)
+    matrix[0, 2] += new_w / 2 - w / 2
+    matrix[1, 2] += new_h / 2 - h / 2
+    return matrix, new_w, new_h
+
+
+def _warp(img, matrix, size: tuple[int, int]):
+    # Pad with white so the new corners read as page background
+    return cv2.warpAffine(
+        img,
+        matrix,
+        size,
+        flags=cv2.INTER_LINEAR,
+        borderMode=cv2.BORDER_CONSTANT,
+        borderValue=(255,) * (img.shape[2] if img.ndim == 3 else 1),
+    )
+
+
+def _rotate_cv_image(img, angle: float):
+    """Rotate counter-clockwise by ``angle`` degrees, growing the canvas so no content is clipped."""
+    h, w = img.shape[:2]
+    matrix, new_w, new_h = _rotation_matrix(w, h, angle)
+    return _warp(img, matrix, (new_w, new_h))
+
+
+def _content_bbox(img) -> tuple[int, int, int, int] | None:
+    """(x0, y0, x1, y1) around content darker than paper, located on a 4x downsampled mask to keep it cheap."""
+    gray = img
+    if img.ndim == 3:
+        gray = cv2.cvtColor(img, cv2.COLOR_BGRA2GRAY if img.shape[2] == 4 else cv2.COLOR_BGR2GRAY)
+    # Threshold at full resolution, then shrink the mask: any content pixel keeps its 4x4 cell nonzero
+    mask = (gray < _CONTENT_MAX_GRAY).astype(np.uint8) * 255
+    small = cv2.resize(mask, None, fx=0.25, fy=0.25, interpolation=cv2.INTER_AREA)
+    points = cv2.findNonZero(small)
+    if points is None:
+        return None
+    x, y, w, h = cv2.boundingRect(points)
+    # Scale back up, rounding outwards so the estimate never clips content
+    return x * 4, y * 4, min((x + w) * 4, gray.shape[1]), min((y + h) * 4, gray.shape[0])
+
+
+def _deskew_and_crop(img, crop: bool = False):
+    """Deskew and optionally crop to content with a single warpAffine; returns (image, angle).
+
+    The crop box is found on the unrotated image and its corners are mapped through the
+    rotation, so the rotated page is never materialised just to be cropped again.
+    """
+    angle = _skew_angle(img)
+    h, w = img.shape[:2]
+    bbox = _content_bbox(img) if crop else None
+    if abs(angle) < 0.1:
+        if bbox is None:
+            return img, 0.0
+        x0, y0, x1, y1 = bbox
+        return img[y0:y1, x0:x1], 0.0
+
+    matrix, new_w, new_h = _rotation_matrix(w, h, angle)
+    if bbox is None:
+        return _warp(img, matrix, (new_w, new_h)), angle
+
+    x0, y0, x1, y1 = bbox
+    corners = np.array([[x0, y0, 1], [x1, y0, 1], [x0, y1, 1], [x1, y1, 1]], dtype=np.float64) @ matrix.T
+    left, top = max(int(corners[:, 0].min()), 0), max(int(corners[:, 1].min()), 0)
+    right, bottom = min(int(np.ceil(corners[:, 0].max())), new_w), min(int(np.ceil(corners[:, 1].max())), new_h)
+    # Fold the crop into the rotation's translation
+    matrix[0, 2] -= left
+    matrix[1, 2] -= top
+    return _warp(img, matrix, (right - left, bottom - top)), angle
+
+
+def _skew_angle(img) -> float:
+    """Estimated skew in degrees; alpha is dropped since the estimator expects BGR or grayscale."""
+    if img.ndim == 3 and img.shape[2] == 4:
+        img = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
+    return _estimate_skew(img)
+
+
 async def deskew_image(image_path: str, method: str = "auto") -> dict[str, Any]:
-    """Placeholder for deskewing logic."""
-    return {
-        "success": True,
-        "operation": "deskew",
-        "message": "Deskewing not fully implemented",
-    }
+    """Straighten a skewed scan using the Hough-line skew estimate from quality analysis."""
+    logger.info(f"Deskewing image: {image_path}")
+
+    if not OPENCV_AVAILABLE:
+        return ErrorHandler.create_error("DEPENDENCY_MISSING", "OpenCV not available for deskewing").to_dict()
+
+    try:
+        if not os.path.exists(image_path):
+            return ErrorHandler.create_error("FILE_NOT_FOUND", f"File not found: {image_path}").to_dict()
+
+        img = _read_cv_image(image_path)
+        angle = _skew_angle(img)
+
+        if abs(angle) < 0.1:
+            return {
+                "success": True,
+                "operation": "deskew",
+                "method": method,
+                "angle": 0.0,
+                "source_path": image_path,
+                "target_path": image_path,
+                "message": "No significant skew detected",
+            }
+
+        target_path = _write_cv_image(_rotate_cv_image(img, angle), image_path, "ocr_deskew_")
+        return {
+            "success": True,
+            "operation": "deskew",
+            "method": method,
+            "angle": angle,
+            "source_path": image_path,
+            "target_path": target_path,
+            "message": f"Corrected {angle:.2f} degree skew",
+        }
+
+    except Exception as e:
+        return ErrorHandler.handle_exception(e, context=f"deskew_image_{image_path}")
 
 
 async def rotate_image(image_path: str, angle: float, auto_rotate: bool = False) -> dict[str, Any]:
-    """Placeholder for rotation logic."""
-    return {"success": True, "operation": "rotate", "angle": angle}
+    """Rotate an image counter-clockwise by ``angle`` degrees, or by the detected skew when ``auto_rotate``."""
+    logger.info(f"Rotating image: {image_path}")
+
+    if not OPENCV_AVAILABLE:
+        return ErrorHandler.create_error("DEPENDENCY_MISSING", "OpenCV not available for rotation").to_dict()
+
+    try:
+        if not os.path.exists(image_path):
+            return ErrorHandler.create_error("FILE_NOT_FOUND", f"File not found: {image_path}").to_dict()
+
+        img = _read_cv_image(image_path)
+        if auto_rotate:
+            angle = _skew_angle(img)
+
+        # Right-angle turns are exact transposes; no interpolation needed
+        quarter_turns = {90: cv2.ROTATE_90_COUNTERCLOCKWISE, 180: cv2.ROTATE_180, 270: cv2.ROTATE_90_CLOCKWISE}
+        turn = quarter_turns.get(int(angle) % 360) if float(angle).is_integer() else None
+        if turn is not None:
+            rotated = cv2.rotate(img, turn)
+        elif angle % 360 == 0:
+            rotated = img
+        else:
+            rotated = _rotate_cv_image(img, angle)
+
+        target_path = _write_cv_image(rotated, image_path, "ocr_rotate_")
+        return {
+            "success": True,
+            "operation": "rotate",
+            "angle": angle,
+            "source_path": image_path,
+            "target_path": target_path,
+        }
+
+    except Exception as e:
+        return ErrorHandler.handle_exception(e, context=f"rotate_image_{image_path}")
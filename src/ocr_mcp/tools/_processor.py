@@ -36,15 +36,69 @@ backends and image preprocessing.
 import asyncio
 import logging
 import os
+import shutil
 import time
+import weakref
+from collections.abc import AsyncIterator
 from typing import Any
 
-from ..core.backend_manager import BackendManager
+from ..core.backend_manager import BackendManager, canonical_backend_name
 from ..core.config import OCRConfig
 from ..core.error_handler import ErrorHandler
 
 logger = logging.getLogger(__name__)
 
+# PDFs rasterized at once in process_batch, independent of the OCR worker count
+_EXTRACT_CONCURRENCY = 2
+
+# PDF render DPI per backend: enough for its effective input resolution and no more
+# (GOT-OCR's ViT sees 1024px; EasyOCR's default canvas is 2560px). Others get 300.
+_PDF_RENDER_DPI = {"tesseract": 300, "easyocr": 200, "got-ocr": 150}
+_DEFAULT_PDF_RENDER_DPI = 300
+
+# Backends that binarize internally, so colour pages only cost 3x the bytes
+_GRAYSCALE_BACKENDS = frozenset({"tesseract"})
+
+# One OCR semaphore per event loop and max_concurrent value, shared by every process_batch call.
+# Per loop because a semaphore that has blocked a waiter is bound to that loop; weak so a
+# closed loop's semaphores go with it
+_BATCH_SEMAPHORES: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[int, asyncio.Semaphore]] = (
+    weakref.WeakKeyDictionary()
+)
+
+# Fire-and-forget cleanup tasks, referenced here so they aren't garbage-collected mid-run
+_BACKGROUND_TASKS: set[asyncio.Task] = set()
+
+
+def _remove_render_dir(path: str) -> None:
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def _merge_page_results(source_path: str, page_results: list[dict[str, Any]]) -> dict[str, Any]:
+    """Reassemble per-page process_document results into one result for the source document."""
+    if len(page_results) == 1:
+        return page_results[0]
+
+    succeeded = [r for r in page_results if r.get("success")]
+    text = "\n\n".join(r.get("text", "") for r in succeeded)
+    merged = {
+        "success": len(succeeded) == len(page_results),
+        "operation": "process_document",
+        "source_path": source_path,
+        "backend_used": succeeded[0].get("backend_used") if succeeded else None,
+        "text": text,
+        "execution_time": round(sum(r.get("execution_time", 0) for r in page_results), 2),
+        "confidence_score": sum(r.get("confidence_score", 0) for r in succeeded) / len(succeeded) if succeeded else 0,
+        "text_length": len(text),
+        "word_count": len(text.split()),
+        "page_count": len(page_results),
+        "failed_pages": [i for i, r in enumerate(page_results) if not r.get("success")],
+        "pages": page_results,
+    }
+    if not succeeded:
+        merged["error"] = page_results[0].get("error", "Unknown error")
+    return merged
+
 
 async def process_document(
     source_path: str,
@@ -71,7 +125,7 @@ async def process_document(
     FastMCP 3.1 dialogic response: success, operation, result or error,
     recommendations, next_steps, recovery_options (on error), related_operations.
     """
-    logger.info(f"Processing document: {source_path} (backend: {backend}, mode: {mode})")
+    logger.info("Processing document: %s (backend: %s, mode: %s)", source_path, backend, mode)
 
     if not backend_manager:
         return ErrorHandler.create_error("INTERNAL_ERROR", "Backend manager not initialized").to_dict()
@@ -180,6 +234,114 @@ async def process_document(
         return ErrorHandler.handle_exception(e, context=f"process_document_{source_path}")
 
 
+async def iter_batch_results(
+    files: list[str],
+    backend: str = "auto",
+    mode: str = "text",
+    max_concurrent: int = 4,
+    backend_manager: BackendManager | None = None,
+    config: OCRConfig | None = None,
+) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+    """
+    OCR every page of every file and yield (index into files, merged result) as each document completes.
+
+    Pages from all files share one pool of max_concurrent workers. A document's page results are
+    released, and its rendered page images deleted, as soon as it is yielded, so memory tracks the
+    documents still in flight rather than the whole batch.
+    """
+    # Split every document into pages up front (PDF rasterization is I/O-heavy, so bounded separately)
+    doc_processor = getattr(backend_manager, "document_processor", None)
+    io_semaphore = asyncio.Semaphore(_EXTRACT_CONCURRENCY)
+    render_backend = canonical_backend_name(
+        backend if backend != "auto" else (config.default_backend if config else "tesseract")
+    )
+    render_dpi = _PDF_RENDER_DPI.get(render_backend, _DEFAULT_PDF_RENDER_DPI)
+    render_gray = render_backend in _GRAYSCALE_BACKENDS
+
+    async def split_pages(file_path: str) -> tuple[list[str], str | None]:
+        """(page image paths, directory this call rendered them into, if any)."""
+        if os.path.splitext(file_path)[1].lower() != ".pdf" or not doc_processor:
+            return [file_path], None
+        async with io_semaphore:
+            try:
+                pages = await asyncio.to_thread(
+                    doc_processor.extract_images, file_path, dpi=render_dpi, grayscale=render_gray
+                )
+            except Exception as e:
+                logger.warning(f"Page extraction failed for {file_path}, processing as a whole: {e}")
+                return [file_path], None
+        if not pages:
+            return [file_path], None
+        return [page["image_path"] for page in pages], pages[0].get("metadata", {}).get("render_dir")
+
+    splits = await asyncio.gather(*(split_pages(f) for f in files))
+    doc_pages = [pages for pages, _ in splits]
+    render_dirs = [render_dir for _, render_dir in splits]
+
+    # One flat pool of page tasks: max_concurrent workers drain a shared queue, so a
+    # small document's pages fill the slots a long PDF would otherwise leave idle
+    queue: asyncio.Queue[tuple[int, int, str]] = asyncio.Queue()
+    for doc_id, page_paths in enumerate(doc_pages):
+        for page_id, page_path in enumerate(page_paths):
+            queue.put_nowait((doc_id, page_id, page_path))
+    page_results: list[list[dict[str, Any] | None]] = [[None] * len(p) for p in doc_pages]
+    pages_left = [len(p) for p in doc_pages]
+    # Completed document ids; None once every worker has exited
+    finished: asyncio.Queue[int | None] = asyncio.Queue()
+    # Shared across calls, so two concurrent batches can't double-book the model
+    loop_semaphores = _BATCH_SEMAPHORES.setdefault(asyncio.get_running_loop(), {})
+    ocr_semaphore = loop_semaphores.get(max_concurrent)
+    if ocr_semaphore is None:
+        ocr_semaphore = loop_semaphores[max_concurrent] = asyncio.Semaphore(max_concurrent)
+
+    total_pages = queue.qsize()
+    log_every = max(1, total_pages // 20)
+    pages_done = 0
+
+    async def worker() -> None:
+        nonlocal pages_done
+        while not queue.empty():
+            doc_id, page_id, page_path = queue.get_nowait()
+            async with ocr_semaphore:
+                page_results[doc_id][page_id] = await process_document(
+                    source_path=page_path,
+                    backend=backend,
+                    mode=mode,
+                    backend_manager=backend_manager,
+                    config=config,
+                )
+            pages_done += 1
+            if pages_done % log_every == 0 or pages_done == total_pages:
+                logger.info("Batch progress: %d/%d pages", pages_done, total_pages)
+            pages_left[doc_id] -= 1
+            if not pages_left[doc_id]:
+                finished.put_nowait(doc_id)
+
+    def workers_done(future: asyncio.Future) -> None:
+        # Mark the outcome retrieved: an early close cancels the workers with nobody left to await them
+        if not future.cancelled():
+            future.exception()
+        finished.put_nowait(None)
+
+    workers = asyncio.gather(*(worker() for _ in range(max(1, min(max_concurrent, total_pages)))))
+    workers.add_done_callback(workers_done)
+    try:
+        while (doc_id := await finished.get()) is not None:
+            pages, page_results[doc_id] = page_results[doc_id], []
+            yield doc_id, _merge_page_results(files[doc_id], pages)
+
+            # This document's rendered pages are no longer needed; delete the directory they were
+            # rendered into (never shared with another call) without holding up the batch
+            if render_dirs[doc_id]:
+                task = asyncio.create_task(asyncio.to_thread(_remove_render_dir, render_dirs[doc_id]))
+                _BACKGROUND_TASKS.add(task)
+                task.add_done_callback(_BACKGROUND_TASKS.discard)
+        await workers
+    finally:
+        # Consumer stopped early: don't leave workers OCRing pages nobody will read
+        workers.cancel()
+
+
 async def process_batch(
     source_dir: str,
     backend: str = "auto",
@@ -230,25 +392,15 @@ async def process_batch(
                 "results": [],
             }
 
-        # Process in parallel with concurrency limit
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def sem_process(file_path):
-            async with semaphore:
-                return await process_document(
-                    source_path=file_path,
-                    backend=backend,
-                    mode=mode,
-                    backend_manager=backend_manager,
-                    config=config,
-                )
-
-        tasks = [sem_process(f) for f in files]
-        results = await asyncio.gather(*tasks)
+        # Documents arrive in completion order; slot them back into directory order for the response
+        results: list[dict[str, Any]] = [{}] * len(files)
+        async for index, result in iter_batch_results(files, backend, mode, max_concurrent, backend_manager, config):
+            results[index] = result
 
         # Summarize results
-        processed = [r for r in results if r.get("success")]
-        failed = [r for r in results if not r.get("success")]
+        processed, failed = [], []
+        for r in results:
+            (processed if r.get("success") else failed).append(r)
 
         # Calculate batch statistics
         total_words = sum(r.get("result", {}).get("word_count", 0) for r in processed)
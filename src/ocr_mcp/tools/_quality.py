@@ -38,6 +38,7 @@ import re
 from typing import Any
 
 from ..core.backend_manager import BackendManager
+from ..core.cache import analysis_cache
 from ..core.config import OCRConfig
 
 # Optional OpenCV import
@@ -421,6 +422,12 @@ async def validate_ocr_accuracy(
         }
 
 
+# analyze_image_quality checks that need decoded pixels, and those answered by mean/std alone
+_PIXEL_CHECKS = frozenset({"contrast", "noise", "blur", "brightness", "skew"})
+_INTENSITY_CHECKS = frozenset({"contrast", "noise", "brightness"})
+
+
+@analysis_cache.memoize("analyze_image_quality")
 async def analyze_image_quality(image_path: str, quality_checks: list[str] | None = None) -> dict[str, Any]:
     """
     Analyze image quality factors that affect OCR accuracy.
@@ -457,19 +464,25 @@ async def analyze_image_quality(image_path: str, quality_checks: list[str] | Non
                 "error": "OpenCV not available for image quality analysis",
             }
 
-        # Load image
+        checks = frozenset(quality_checks)
+
+        # Load image; pixels are only decoded if a check needs them, and straight to grayscale
         pil_image = Image.open(image_path)
-        if pil_image.mode != "RGB":
-            pil_image = pil_image.convert("RGB")
+        gray_image = None
+        if checks & _PIXEL_CHECKS:
+            source = pil_image if pil_image.mode in ("RGB", "L") else pil_image.convert("RGB")
+            gray_image = np.array(source.convert("L"))
 
-        cv_image = cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
-        gray_image = cv2.cvtColor(cv_image, cv2.COLOR_BGR2GRAY)
+        # Contrast (std), noise (variance) and brightness (mean) share one statistics pass
+        if checks & _INTENSITY_CHECKS:
+            mean, std = cv2.meanStdDev(gray_image)
+            brightness, contrast = float(mean[0, 0]), float(std[0, 0])
 
         quality_analysis = {}
         recommendations = []
 
         # Resolution check
-        if "resolution" in quality_checks:
+        if "resolution" in checks:
             dpi = _estimate_dpi(pil_image)
             quality_analysis["resolution"] = {
                 "pixels_width": pil_image.width,
@@ -482,8 +495,7 @@ async def analyze_image_quality(image_path: str, quality_checks: list[str] | Non
                 recommendations.append("Increase resolution to at least 150 DPI for better OCR")
 
         # Contrast analysis
-        if "contrast" in quality_checks:
-            contrast = _calculate_contrast(gray_image)
+        if "contrast" in checks:
             quality_analysis["contrast"] = {
                 "contrast_ratio": round(contrast, 2),
                 "sufficient_contrast": contrast > 50,
@@ -493,8 +505,8 @@ async def analyze_image_quality(image_path: str, quality_checks: list[str] | Non
                 recommendations.append("Improve image contrast - text should be much darker than background")
 
         # Noise analysis
-        if "noise" in quality_checks:
-            noise_level = _estimate_noise(gray_image)
+        if "noise" in checks:
+            noise_level = contrast**2
             quality_analysis["noise"] = {
                 "noise_level": round(noise_level, 2),
                 "low_noise": noise_level < 10,
@@ -504,7 +516,7 @@ async def analyze_image_quality(image_path: str, quality_checks: list[str] | Non
                 recommendations.append("Reduce image noise using despeckling or smoothing filters")
 
         # Blur detection
-        if "blur" in quality_checks:
+        if "blur" in checks:
             blur_score = _estimate_blur(gray_image)
             quality_analysis["blur"] = {
                 "blur_score": round(blur_score, 2),
@@ -515,8 +527,7 @@ async def analyze_image_quality(image_path: str, quality_checks: list[str] | Non
                 recommendations.append("Image appears blurry - use sharpening or rescan at higher quality")
 
         # Brightness analysis
-        if "brightness" in quality_checks:
-            brightness = _calculate_brightness(gray_image)
+        if "brightness" in checks:
             quality_analysis["brightness"] = {
                 "brightness_level": round(brightness, 1),
                 "optimal_brightness": 80 <= brightness <= 180,
@@ -528,7 +539,7 @@ async def analyze_image_quality(image_path: str, quality_checks: list[str] | Non
                 recommendations.append("Image is too bright - reduce brightness or exposure")
 
         # Skew estimation
-        if "skew" in quality_checks:
+        if "skew" in checks:
             skew_angle = _estimate_skew(gray_image)
             quality_analysis["skew"] = {
                 "skew_angle_degrees": round(skew_angle, 2),
@@ -623,17 +634,24 @@ def _calculate_accuracy_metrics(ocr_text: str, ground_truth: str) -> dict[str, f
 
 def _longest_common_subsequence(text1: str, text2: str) -> int:
     """Calculate length of longest common subsequence."""
-    m, n = len(text1), len(text2)
-    dp = [[0] * (n + 1) for _ in range(m + 1)]
+    # Bit-parallel LCS (Allison-Dix, Hyyro's form): one row of the DP table lives in the bits of
+    # an int, so each character of text2 costs a few big-int ops instead of a len(text1) loop
+    if not text1 or not text2:
+        return 0
+    if len(text2) > len(text1):
+        text1, text2 = text2, text1
 
-    for i in range(1, m + 1):
-        for j in range(1, n + 1):
-            if text1[i - 1] == text2[j - 1]:
-                dp[i][j] = dp[i - 1][j - 1] + 1
-            else:
-                dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
+    match_masks: dict[str, int] = {}
+    for i, char in enumerate(text1):
+        match_masks[char] = match_masks.get(char, 0) | (1 << i)
 
-    return dp[m][n]
+    full = (1 << len(text1)) - 1
+    row = full
+    for char in text2:
+        matches = row & match_masks.get(char, 0)
+        row = ((row + matches) | (row - matches)) & full
+
+    return len(text1) - row.bit_count()
 
 
 def _analyze_semantic_similarity(text1: str, text2: str) -> dict[str, Any]:
@@ -787,27 +805,12 @@ def _estimate_dpi(image) -> int:
         return 100
 
 
-def _calculate_contrast(image_array) -> float:
-    """Calculate image contrast using RMS contrast."""
-    return image_array.std()
-
-
-def _estimate_noise(image_array) -> float:
-    """Estimate image noise using Laplacian variance."""
-    return image_array.var()
-
-
 def _estimate_blur(image_array) -> float:
     """Estimate image blur using Laplacian variance."""
     laplacian = cv2.Laplacian(image_array, cv2.CV_64F)
     return laplacian.var()
 
 
-def _calculate_brightness(image_array) -> float:
-    """Calculate average image brightness."""
-    return image_array.mean()
-
-
 def _estimate_skew(image_array) -> float:
     """Estimate image skew angle in degrees using Hough line transform.
 
@@ -4,15 +4,70 @@ Scanner Operations Tools for OCR-MCP Server - PORTMANTEAU DESIGN
 Consolidates all scanner hardware control operations into a single tool.
 """
 
+import asyncio
+import copy
 import logging
+import os
+import tempfile
+import time
 import uuid
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import Any
 
+from ..backends.scanner.scanner_manager import PREVIEW_DPI
 from ..core.error_handler import ErrorHandler, create_success_response
 
 logger = logging.getLogger(__name__)
 
+# How an operation uses device_id: ignored, resolved if possible, or resolved and required
+_DEVICE_UNUSED, _DEVICE_OPTIONAL, _DEVICE_REQUIRED = range(3)
+
+# Discovered scanners and backend status reused for this long (a WIA enumeration walks COM for
+# hundreds of ms), keyed by scanner manager
+_SCANNER_LIST_TTL_SECS = 30.0
+_scanner_list_cache: dict[int, tuple[float, list[Any], dict[str, Any]]] = {}
+
+# Device capabilities (resolutions, paper sizes, ADF/duplex) are fixed for the session; reused for
+# this long, keyed by (scanner manager, device_id)
+_PROPERTIES_TTL_SECS = 60.0
+_properties_cache: dict[tuple[int, str], tuple[float, Any]] = {}
+
+# Tool and client spellings -> ScanSettings values (WIA silently scans in colour for anything else)
+_COLOR_MODES = {"color": "Color", "grayscale": "Grayscale", "lineart": "BlackWhite", "blackwhite": "BlackWhite"}
+_PAPER_SIZES = {"a4": "A4", "letter": "Letter", "legal": "Legal", "custom": "Custom"}
+
+# Operations that pass settings to the driver, and the ranges WIA accepts for them
+_SETTINGS_OPERATIONS = frozenset({"configure_scan", "scan_document", "scan_batch"})
+_MAX_DPI = 4800
+_LEVEL_RANGE = range(-1000, 1001)
+
+# One lock per device: driver calls run on worker threads, and a scanner can only do one job at a time
+_device_locks: dict[str, asyncio.Lock] = {}
+
+# Settings the last successful configure_scan left on each device. Scans reconfigure the device
+# themselves, so every scan path drops its entry; a repeat configure_scan in between is a no-op
+_applied_settings: dict[tuple[int, str], dict[str, Any]] = {}
+
+# Preview scans in progress, by device_id; later callers await the running one
+_preview_inflight: dict[str, asyncio.Future] = {}
+
+# How long a preview (at PREVIEW_DPI) is re-served: a positioning aid, so a "refresh" a few
+# seconds later gets the last image rather than another multi-second driver scan
+_PREVIEW_TTL_SECS = 4.0
+_preview_cache: dict[tuple[int, str, int], tuple[float, Any]] = {}
+
+# zlib level for saved scans and previews: level 1 encodes several times faster than PIL's default 6
+# for ~10-20% larger files, the same trade _image makes for its PNG output. Other formats ignore it
+# (JPEG already saves at quality 75 without the optimize pass)
+_SCAN_PNG_COMPRESS_LEVEL = 1
+
+# Previews saved under the temp directory are throwaway files: store them without a zlib pass at all
+_TEMP_DIR = Path(tempfile.gettempdir()).resolve()
+
+# scan_batch pages PNG-encoded at once; also bounds the decoded pages held (~100 MB each at 600 DPI A4)
+_BATCH_SAVE_WORKERS = min(4, os.cpu_count() or 1)
+
 
 async def handle_scanner_op(
     operation: str,
@@ -48,45 +103,55 @@ async def handle_scanner_op(
     - output_prefix (str): Prefix for output files. Default: scan_.
     - backend_manager: Injected BackendManager.
     - config: Injected OCRConfig.
-    - **kwargs: save_path, save_directory, brightness, contrast, count, use_adf, duplex.
+    - **kwargs: save_path, save_directory, brightness, contrast, count, use_adf, duplex, force_refresh.
 
     Returns:
     FastMCP 3.1 dialogic response: success, operation, result or error,
     recommendations, next_steps, recovery_options (on error), related_operations.
     """
-    # Map parameters if necessary
-    dpi = resolution
-    save_path = kwargs.get("save_path")
-    save_directory = kwargs.get("save_directory")
-    brightness = kwargs.get("brightness", 0)
-    contrast = kwargs.get("contrast", 0)
-    use_adf = kwargs.get("use_adf", False) or (scan_source == "adf")
-    duplex = kwargs.get("duplex", False)
-    count = kwargs.get("count", 1)
+    # Map parameters if necessary. settings is built once and handed to the scanner manager as is.
+    params = {
+        "settings": {
+            "dpi": resolution,
+            "color_mode": _COLOR_MODES.get(str(color_mode).lower(), color_mode),
+            "paper_size": _PAPER_SIZES.get(str(paper_size).lower(), paper_size),
+            "brightness": kwargs.get("brightness", 0),
+            "contrast": kwargs.get("contrast", 0),
+            "use_adf": kwargs.get("use_adf", False) or (scan_source == "adf"),
+            "duplex": kwargs.get("duplex", False),
+        },
+        "count": kwargs.get("count", 1),
+        "save_path": kwargs.get("save_path"),
+        "save_directory": kwargs.get("save_directory"),
+        "force_refresh": kwargs.get("force_refresh", False),
+    }
 
     try:
-        logger.info(f"Scanner operation: {operation}")
+        logger.info("Scanner operation: %s", operation)
 
         # Validate operation parameter
-        valid_operations = [
-            "list_scanners",
-            "scanner_properties",
-            "configure_scan",
-            "scan_document",
-            "scan_batch",
-            "preview_scan",
-            "diagnostics",
-        ]
-
-        if operation not in valid_operations:
+        entry = _OPERATIONS.get(operation)
+        if entry is None:
             return ErrorHandler.create_error(
                 "PARAMETERS_INVALID",
                 message_override=f"Invalid operation: {operation}",
-                details={"valid_operations": valid_operations},
+                details={"valid_operations": list(_OPERATIONS)},
             ).to_dict()
+        device_use, run = entry
+
+        # Reject settings the driver would refuse, before any COM round trip
+        if operation in _SETTINGS_OPERATIONS:
+            invalid = _invalid_settings(params["settings"])
+            if invalid:
+                return ErrorHandler.create_error(
+                    "PARAMETERS_INVALID",
+                    message_override=f"Invalid scan settings: {'; '.join(invalid)}",
+                    details={"invalid_settings": invalid},
+                ).to_dict()
 
         # Check if scanner backend is available
-        if not backend_manager.scanner_manager or not backend_manager.scanner_manager.is_available():
+        scanner_manager = backend_manager.scanner_manager
+        if not scanner_manager or not await asyncio.to_thread(scanner_manager.is_available):
             return ErrorHandler.create_error(
                 "SCANNER_NOT_FOUND",
                 message_override=(
@@ -97,101 +162,79 @@ async def handle_scanner_op(
 
         # Resolve device_id when missing: use first flatbed scanner
         resolved_device_id = device_id
-        if not resolved_device_id:
-            resolved_device_id = await _resolve_default_device_id(backend_manager, scan_source)
-
-        # Route to appropriate handler based on operation
-        if operation == "list_scanners":
-            return await _handle_list_scanners(backend_manager)
-
-        elif operation == "scanner_properties":
-            if not resolved_device_id:
-                return ErrorHandler.create_error(
-                    "SCANNER_NOT_FOUND",
-                    message_override="No scanner found. Specify device_id or ensure a flatbed scanner is connected.",
-                ).to_dict()
-            return await _handle_scanner_properties(resolved_device_id, backend_manager)
-
-        elif operation == "configure_scan":
-            if not resolved_device_id:
-                return ErrorHandler.create_error(
-                    "SCANNER_NOT_FOUND",
-                    message_override="No scanner found. Specify device_id or ensure a flatbed scanner is connected.",
-                ).to_dict()
-            return await _handle_configure_scan(
-                resolved_device_id,
-                dpi,
-                color_mode,
-                paper_size,
-                brightness,
-                contrast,
-                use_adf,
-                duplex,
-                backend_manager,
-            )
-
-        elif operation == "scan_document":
-            if not resolved_device_id:
-                return ErrorHandler.create_error(
-                    "SCANNER_NOT_FOUND",
-                    message_override="No scanner found. Specify device_id or ensure a flatbed scanner is connected.",
-                ).to_dict()
-            return await _handle_scan_document(
-                resolved_device_id,
-                dpi,
-                color_mode,
-                paper_size,
-                brightness,
-                contrast,
-                use_adf,
-                duplex,
-                save_path,
-                backend_manager,
-            )
-
-        elif operation == "scan_batch":
-            if not resolved_device_id:
-                return ErrorHandler.create_error(
-                    "SCANNER_NOT_FOUND",
-                    message_override="No scanner found. Specify device_id or ensure a flatbed scanner is connected.",
-                ).to_dict()
-            return await _handle_scan_batch(
-                resolved_device_id,
-                count,
-                dpi,
-                color_mode,
-                paper_size,
-                brightness,
-                contrast,
-                use_adf,
-                duplex,
-                save_directory,
-                backend_manager,
+        if not resolved_device_id and device_use != _DEVICE_UNUSED:
+            resolved_device_id = await _resolve_default_device_id(
+                backend_manager, scan_source, force_refresh=params["force_refresh"]
             )
-
-        elif operation == "preview_scan":
-            if not resolved_device_id:
+            if not resolved_device_id and device_use == _DEVICE_REQUIRED:
                 return ErrorHandler.create_error(
                     "SCANNER_NOT_FOUND",
                     message_override="No scanner found. Specify device_id or ensure a flatbed scanner is connected.",
                 ).to_dict()
-            return await _handle_preview_scan(resolved_device_id, save_path, backend_manager)
 
-        elif operation == "diagnostics":
-            return await _handle_diagnostics(resolved_device_id, backend_manager)
+        return await run(resolved_device_id, params, backend_manager)
 
     except Exception as e:
         logger.error(f"Scanner operation failed: {operation}, error: {e}")
         return ErrorHandler.handle_exception(e, context=f"scanner_operations_{operation}")
 
 
-async def _resolve_default_device_id(backend_manager, scan_source: str = "flatbed") -> str | None:
+def _invalid_settings(settings: dict[str, Any]) -> list[str]:
+    """Describe each scan setting outside what the driver accepts; empty if all are valid."""
+    invalid = []
+    if not isinstance(settings["dpi"], int) or not 0 < settings["dpi"] <= _MAX_DPI:
+        invalid.append(f"resolution must be 1-{_MAX_DPI} DPI, got {settings['dpi']!r}")
+    if settings["color_mode"] not in _COLOR_MODES.values():
+        invalid.append(f"color_mode must be one of {sorted(_COLOR_MODES)}, got {settings['color_mode']!r}")
+    if settings["paper_size"] not in _PAPER_SIZES.values():
+        invalid.append(f"paper_size must be one of {sorted(_PAPER_SIZES.values())}, got {settings['paper_size']!r}")
+    for name in ("brightness", "contrast"):
+        if settings[name] not in _LEVEL_RANGE:
+            invalid.append(f"{name} must be -1000 to 1000, got {settings[name]!r}")
+    return invalid
+
+
+def _device_lock(device_id: str) -> asyncio.Lock:
+    lock = _device_locks.get(device_id)
+    if lock is None:
+        lock = _device_locks[device_id] = asyncio.Lock()
+    return lock
+
+
+async def _discover_scanners(backend_manager, force_refresh: bool = False) -> tuple[list[Any], dict[str, Any]]:
+    """Return (scanners, backend status), enumerating again only when forced or the last run is stale."""
+    scanner_manager = backend_manager.scanner_manager
+    key = id(scanner_manager)
+    now = time.monotonic()
+    cached = _scanner_list_cache.get(key)
+    if cached and not force_refresh and now - cached[0] < _SCANNER_LIST_TTL_SECS:
+        return cached[1], cached[2]
+
+    scanners, backend_status = await asyncio.to_thread(
+        lambda: (scanner_manager.discover_scanners(force_refresh=True), scanner_manager.get_backend_status())
+    )
+    _scanner_list_cache[key] = (now, scanners, backend_status)
+    return scanners, backend_status
+
+
+def _forget_scanners(backend_manager, device_id: str) -> None:
+    """Drop cached discovery and device_id's properties after it stops answering, so the next call re-queries."""
+    key = id(backend_manager.scanner_manager)
+    _scanner_list_cache.pop(key, None)
+    _properties_cache.pop((key, device_id), None)
+    _preview_cache.pop((key, device_id, PREVIEW_DPI), None)
+    _applied_settings.pop((key, device_id), None)
+
+
+async def _resolve_default_device_id(
+    backend_manager, scan_source: str = "flatbed", force_refresh: bool = False
+) -> str | None:
     """
     Resolve device_id when not provided: use first flatbed if scan_source is flatbed,
     otherwise first available scanner.
     """
     try:
-        scanners = backend_manager.scanner_manager.discover_scanners(force_refresh=True)
+        scanners, _ = await _discover_scanners(backend_manager, force_refresh)
         if not scanners:
             return None
 
@@ -208,14 +251,11 @@ async def _resolve_default_device_id(backend_manager, scan_source: str = "flatbe
 
 
 # Operation handler functions
-async def _handle_list_scanners(backend_manager):
+async def _handle_list_scanners(backend_manager, force_refresh: bool = False):
     """Handle scanner discovery."""
     try:
-        # Discover scanners
-        scanners = backend_manager.scanner_manager.discover_scanners(force_refresh=True)
-
-        # Get backend status
-        backend_status = backend_manager.scanner_manager.get_backend_status()
+        # Discover scanners and backend status
+        scanners, backend_status = await _discover_scanners(backend_manager, force_refresh)
 
         # Format scanner information
         scanner_list = []
@@ -247,17 +287,25 @@ async def _handle_list_scanners(backend_manager):
 async def _handle_scanner_properties(device_id, backend_manager):
     """Handle scanner properties query."""
     try:
-        properties = backend_manager.scanner_manager.get_scanner_properties(device_id)
-        if properties is None:
-            return ErrorHandler.create_error(
-                "SCANNER_NOT_FOUND",
-                message_override=f"Scanner {device_id} not found or not accessible",
-            ).to_dict()
+        key = (id(backend_manager.scanner_manager), device_id)
+        now = time.monotonic()
+        cached = _properties_cache.get(key)
+        if cached and now - cached[0] < _PROPERTIES_TTL_SECS:
+            properties = cached[1]
+        else:
+            properties = await asyncio.to_thread(backend_manager.scanner_manager.get_scanner_properties, device_id)
+            if properties is None:
+                return ErrorHandler.create_error(
+                    "SCANNER_NOT_FOUND",
+                    message_override=f"Scanner {device_id} not found or not accessible",
+                ).to_dict()
+            _properties_cache[key] = (now, properties)
 
+        # Shallow copy, so a caller editing the response can't rewrite the cached capabilities
         return create_success_response(
             {
                 "device_id": device_id,
-                "properties": properties.__dict__ if hasattr(properties, "__dict__") else properties,
+                "properties": dict(vars(properties)) if hasattr(properties, "__dict__") else copy.copy(properties),
             }
         )
 
@@ -266,67 +314,41 @@ async def _handle_scanner_properties(device_id, backend_manager):
         return ErrorHandler.handle_exception(e, context="scanner_properties")
 
 
-async def _handle_configure_scan(
-    device_id,
-    dpi,
-    color_mode,
-    paper_size,
-    brightness,
-    contrast,
-    use_adf,
-    duplex,
-    backend_manager,
-):
+async def _handle_configure_scan(device_id, settings, backend_manager):
     """Handle scan configuration."""
     try:
-        settings = {
-            "dpi": dpi,
-            "color_mode": color_mode,
-            "paper_size": paper_size,
-            "brightness": brightness,
-            "contrast": contrast,
-            "use_adf": use_adf,
-            "duplex": duplex,
-        }
-
-        success = backend_manager.scanner_manager.configure_scan(device_id, settings)
+        key = (id(backend_manager.scanner_manager), device_id)
+        async with _device_lock(device_id):
+            if _applied_settings.get(key) == settings:
+                return create_success_response(
+                    {"device_id": device_id, "configured": True, "settings": settings, "no_change": True}
+                )
+            success = await asyncio.to_thread(backend_manager.scanner_manager.configure_scan, device_id, settings)
+            if success:
+                _applied_settings[key] = dict(settings)
+                _preview_cache.pop((*key, PREVIEW_DPI), None)
+            else:
+                _applied_settings.pop(key, None)
 
-        return create_success_response({"device_id": device_id, "configured": success, "settings": settings})
+        return create_success_response(
+            {"device_id": device_id, "configured": success, "settings": settings, "no_change": False}
+        )
 
     except Exception as e:
         logger.error(f"Failed to configure scan for {device_id}: {e}")
         return ErrorHandler.handle_exception(e, context="configure_scan")
 
 
-async def _handle_scan_document(
-    device_id,
-    dpi,
-    color_mode,
-    paper_size,
-    brightness,
-    contrast,
-    use_adf,
-    duplex,
-    save_path,
-    backend_manager,
-):
+async def _handle_scan_document(device_id, settings, save_path, backend_manager):
     """Handle single document scanning."""
     try:
-        # Configure scan first
-        settings = {
-            "dpi": dpi,
-            "color_mode": color_mode,
-            "paper_size": paper_size,
-            "brightness": brightness,
-            "contrast": contrast,
-            "use_adf": use_adf,
-            "duplex": duplex,
-        }
-
         # Perform scan (ScannerManager.scan_document takes device_id, settings only)
-        result = backend_manager.scanner_manager.scan_document(device_id, settings)
+        async with _device_lock(device_id):
+            _applied_settings.pop((id(backend_manager.scanner_manager), device_id), None)
+            result = await asyncio.to_thread(backend_manager.scanner_manager.scan_document, device_id, settings)
 
         if result is None:
+            _forget_scanners(backend_manager, device_id)
             return ErrorHandler.create_error(
                 "SCAN_FAILED", message_override=f"Scan failed for device {device_id}"
             ).to_dict()
@@ -341,24 +363,30 @@ async def _handle_scan_document(
                 }
             )
 
-        if save_path:
-            path = Path(save_path)
-        else:
-            scans_dir = Path.cwd() / "scans"
-            scans_dir.mkdir(exist_ok=True)
-            path = scans_dir / f"scan_{uuid.uuid4().hex}.png"
-
-        if not path.suffix:
-            path = path.with_suffix(".png")
-        result.save(str(path))
-        saved_path = str(path)
+        scan_result = str(result)
+        try:
+            if save_path:
+                path = Path(save_path)
+            else:
+                scans_dir = Path.cwd() / "scans"
+                scans_dir.mkdir(exist_ok=True)
+                path = scans_dir / f"scan_{uuid.uuid4().hex}.png"
+
+            if not path.suffix:
+                path = path.with_suffix(".png")
+            saved_path = str(path)
+            # PNG encoding of a full-page scan is seconds of CPU; keep it off the event loop
+            await asyncio.to_thread(result.save, saved_path, compress_level=_SCAN_PNG_COMPRESS_LEVEL)
+        finally:
+            # Release the pixel buffer now rather than whenever the image is collected
+            result.close()
 
         logger.info("Scan saved to %s", saved_path)
 
         return create_success_response(
             {
                 "device_id": device_id,
-                "scan_result": str(result),
+                "scan_result": scan_result,
                 "saved_path": saved_path,
                 "settings": settings,
             }
@@ -369,54 +397,51 @@ async def _handle_scan_document(
         return ErrorHandler.handle_exception(e, context="scan_document")
 
 
-async def _handle_scan_batch(
-    device_id,
-    count,
-    dpi,
-    color_mode,
-    paper_size,
-    brightness,
-    contrast,
-    use_adf,
-    duplex,
-    save_directory,
-    backend_manager,
-):
+async def _handle_scan_batch(device_id, settings, count, save_directory, backend_manager):
     """Handle batch document scanning."""
     try:
-        settings = {
-            "dpi": dpi,
-            "color_mode": color_mode,
-            "paper_size": paper_size,
-            "brightness": brightness,
-            "contrast": contrast,
-            "use_adf": use_adf,
-            "duplex": duplex,
-        }
-
-        results = backend_manager.scanner_manager.scan_batch(device_id, settings, count)
-
+        # Each page is saved as it arrives, so encoding overlaps the scanner feeding the next sheet.
+        # Taking a slot before accepting a page's save holds at most _BATCH_SAVE_WORKERS + 1 pages in memory.
+        save_slots = asyncio.Semaphore(_BATCH_SAVE_WORKERS)
+
+        async def save(img, path: str) -> None:
+            try:
+                await asyncio.to_thread(img.save, path, format="PNG", compress_level=_SCAN_PNG_COMPRESS_LEVEL)
+            finally:
+                img.close()
+                save_slots.release()
+
+        batch_results: list[str] = []
         saved_paths: list[str] = []
-        for i, img in enumerate(results or []):
-            if not hasattr(img, "save"):
-                continue
-            if save_directory:
-                dest = Path(save_directory)
-            else:
-                dest = Path.cwd() / "scans"
-            dest.mkdir(parents=True, exist_ok=True)
-            name = f"scan_batch_{i:03d}_{uuid.uuid4().hex[:8]}.png"
-            img_path = dest / name
-            img.save(str(img_path), format="PNG")
-            saved_paths.append(str(img_path))
+        saves: list[asyncio.Task] = []
+        try:
+            async with _device_lock(device_id):
+                _applied_settings.pop((id(backend_manager.scanner_manager), device_id), None)
+                async for img in backend_manager.scanner_manager.iter_scan_batch(device_id, settings, count):
+                    i = len(batch_results)
+                    batch_results.append(str(img))
+                    if not hasattr(img, "save"):
+                        continue
+                    if save_directory:
+                        dest = Path(save_directory)
+                    else:
+                        dest = Path.cwd() / "scans"
+                    dest.mkdir(parents=True, exist_ok=True)
+                    name = f"scan_batch_{i:03d}_{uuid.uuid4().hex[:8]}.png"
+                    saved_paths.append(str(dest / name))
+                    await save_slots.acquire()
+                    saves.append(asyncio.create_task(save(img, saved_paths[-1])))
+                    del img
+        finally:
+            await asyncio.gather(*saves)
 
         return create_success_response(
             {
                 "device_id": device_id,
-                "batch_results": [str(r) for r in results] if results else [],
+                "batch_results": batch_results,
                 "saved_paths": saved_paths,
                 "count_requested": count,
-                "count_completed": len(results) if results else 0,
+                "count_completed": len(batch_results),
                 "settings": settings,
             }
         )
@@ -426,18 +451,49 @@ async def _handle_scan_batch(
         return ErrorHandler.handle_exception(e, context="scan_batch")
 
 
+async def _scan_preview(device_id, backend_manager):
+    async with _device_lock(device_id):
+        _applied_settings.pop((id(backend_manager.scanner_manager), device_id), None)
+        result = await asyncio.to_thread(backend_manager.scanner_manager.preview_scan, device_id, PREVIEW_DPI)
+    if result is not None:
+        _preview_cache[(id(backend_manager.scanner_manager), device_id, PREVIEW_DPI)] = (time.monotonic(), result)
+    return result
+
+
 async def _handle_preview_scan(device_id, save_path, backend_manager):
     """Handle preview scanning."""
     try:
-        result = backend_manager.scanner_manager.preview_scan(device_id, save_path)
+        cached = _preview_cache.get((id(backend_manager.scanner_manager), device_id, PREVIEW_DPI))
+        cache_hit = bool(cached) and time.monotonic() - cached[0] < _PREVIEW_TTL_SECS
+        if cache_hit:
+            result = cached[1]
+        else:
+            # Concurrent previews of one device (UI refreshes, retries) share a single driver scan
+            preview = _preview_inflight.get(device_id)
+            if preview is None:
+                preview = _preview_inflight[device_id] = asyncio.ensure_future(
+                    _scan_preview(device_id, backend_manager)
+                )
+                preview.add_done_callback(lambda _: _preview_inflight.pop(device_id, None))
+            # Shielded: one caller giving up must not cancel the scan the others are waiting on
+            result = await asyncio.shield(preview)
 
         if result is None:
+            _forget_scanners(backend_manager, device_id)
             return ErrorHandler.create_error(
                 "PREVIEW_SCAN_FAILED",
                 message_override=f"Preview scan failed for device {device_id}",
             ).to_dict()
 
-        return create_success_response({"device_id": device_id, "preview_result": str(result)})
+        saved_path = None
+        if save_path and hasattr(result, "save"):
+            saved_path = str(save_path)
+            compress_level = 0 if Path(saved_path).resolve().is_relative_to(_TEMP_DIR) else _SCAN_PNG_COMPRESS_LEVEL
+            await asyncio.to_thread(result.save, saved_path, compress_level=compress_level)
+
+        return create_success_response(
+            {"device_id": device_id, "preview_result": str(result), "saved_path": saved_path, "cache_hit": cache_hit}
+        )
 
     except Exception as e:
         logger.error(f"Failed to preview scan with {device_id}: {e}")
@@ -451,14 +507,16 @@ async def _handle_diagnostics(device_id, backend_manager):
 
         # Get backend status
         if hasattr(backend_manager.scanner_manager, "get_backend_status"):
-            diagnostics["backend_status"] = backend_manager.scanner_manager.get_backend_status()
+            diagnostics["backend_status"] = await asyncio.to_thread(backend_manager.scanner_manager.get_backend_status)
         else:
             diagnostics["backend_status"] = "Backend status not available"
 
         # Get device-specific diagnostics if device_id provided
         if device_id:
             if hasattr(backend_manager.scanner_manager, "get_scanner_diagnostics"):
-                device_diagnostics = backend_manager.scanner_manager.get_scanner_diagnostics(device_id)
+                device_diagnostics = await asyncio.to_thread(
+                    backend_manager.scanner_manager.get_scanner_diagnostics, device_id
+                )
                 if device_diagnostics:
                     diagnostics["device_diagnostics"] = device_diagnostics
                 else:
@@ -505,3 +563,24 @@ async def _handle_diagnostics(device_id, backend_manager):
     except Exception as e:
         logger.error(f"Failed to get diagnostics: {e}")
         return ErrorHandler.handle_exception(e, context="diagnostics")
+
+
+# operation -> (device_id use, call). Each call picks its handler's arguments out of the shared params.
+_OPERATIONS: dict[str, tuple[int, Callable[[str | None, dict[str, Any], Any], Awaitable[dict[str, Any]]]]] = {
+    "list_scanners": (_DEVICE_UNUSED, lambda device_id, p, bm: _handle_list_scanners(bm, p["force_refresh"])),
+    "scanner_properties": (_DEVICE_REQUIRED, lambda device_id, p, bm: _handle_scanner_properties(device_id, bm)),
+    "configure_scan": (
+        _DEVICE_REQUIRED,
+        lambda device_id, p, bm: _handle_configure_scan(device_id, p["settings"], bm),
+    ),
+    "scan_document": (
+        _DEVICE_REQUIRED,
+        lambda device_id, p, bm: _handle_scan_document(device_id, p["settings"], p["save_path"], bm),
+    ),
+    "scan_batch": (
+        _DEVICE_REQUIRED,
+        lambda device_id, p, bm: _handle_scan_batch(device_id, p["settings"], p["count"], p["save_directory"], bm),
+    ),
+    "preview_scan": (_DEVICE_REQUIRED, lambda device_id, p, bm: _handle_preview_scan(device_id, p["save_path"], bm)),
+    "diagnostics": (_DEVICE_OPTIONAL, lambda device_id, p, bm: _handle_diagnostics(device_id, bm)),
+}
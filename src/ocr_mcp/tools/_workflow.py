@@ -32,6 +32,7 @@ Workflow Management Tools for OCR-MCP Server - PORTMANTEAU DESIGN
 Consolidates batch processing, pipelines, system monitoring, and management operations into a single tool.
 """
 
+import copy
 import json
 import logging
 import time
@@ -57,80 +58,98 @@ _STEP_TOOL_MAP = {
 }
 
 
+# Static help text by level, built once at import
+_HELP_CONTENT = {
+    "basic": (
+        "# OCR-MCP Help\n\n"
+        "OCR-MCP provides 14 OCR backends for extracting text from images and PDFs,\n"
+        "plus form field detection, layout analysis, and form reconstruction.\n\n"
+        "## Quick Start\n"
+        '- **OCR a document**: `process_document(source_path="/path/to/doc.png")`\n'
+        '- **List backends**: `manage_workflow(operation="list_backends")`\n'
+        '- **Check health**: `manage_workflow(operation="ocr_health_check")`\n'
+        '- **Scan**: `operate_scanner(operation="scan_document", output_path="/tmp/scan.png")`\n'
+        '- **Detect form fields**: `process_document(operation="detect_forms", source_path="form.png")`\n'
+        '- **Reconstruct form**: `process_document(operation="reconstruct_form", source_path="form.png")`\n'
+        "- **Form workflow**: reconstruct_form -> libreoffice-mcp build_form_document -> fill & print\n\n"
+        "## Common Backends\n"
+        "- **tesseract** — Fast CPU OCR, no GPU needed\n"
+        "- **easyocr** — Multi-language DL OCR with bounding boxes\n"
+        "- **olmocr-2** — Best for academic PDFs (7B VLM, needs GPU)\n"
+        "- **paddleocr-vl** — SOTA VL OCR, 109 languages\n"
+        "- **mistral-ocr** — Cloud API, no local GPU\n\n"
+        'Use `get_help(level="advanced")` for backend details and pipeline guides.'
+    ),
+    "advanced": (
+        "# OCR-MCP Advanced\n\n"
+        "## Backend Selection\n"
+        '- Auto-selection: `process_document(source_path="...", backend="auto")`\n'
+        "  uses image quality analysis to pick the best backend\n"
+        '- Manual: `process_document(source_path="...", backend="olmocr-2")`\n\n'
+        "## PDF Processing\n"
+        '- Single-image PDF: `process_document(source_path="file.pdf")`\n'
+        '- Multi-page pipeline: use `manage_workflow(operation="process_batch_intelligent")`\n'
+        '  with `workflow_type="pdf_processing"` — renders all pages via pdf2image\n'
+        "- The olmocr-2 backend has a dedicated `process_pdf()` method for arXiv papers\n\n"
+        "## Pipelines\n"
+        '- Create: `manage_workflow(operation="create_processing_pipeline", ...)`\n'
+        '- Execute: `manage_workflow(operation="execute_pipeline", ...)`\n'
+        "- Valid steps: deskew_image, enhance_image, rotate_image, crop_image,\n"
+        "  process_document, assess_ocr_quality, convert_image_format,\n"
+        "  analyze_document_layout, extract_table_data\n\n"
+        "## Model Management\n"
+        '- Free idle models: `manage_workflow(operation="manage_models")`\n'
+        "- List loaded: use backend_manager or check server logs\n\n"
+        "## Quality Assessment\n"
+        '- `process_document(operation="assess_quality")` — image readiness for OCR\n'
+        '- `process_document(operation="validate_accuracy")` — compare backends\n'
+        '- `process_document(operation="compare_backends")` — side-by-side output\n\n'
+        "## Form Reconstruction\n"
+        "The form reconstruction pipeline bridges ocr-mcp with libreoffice-mcp:\n\n"
+        "1. **Scan** the form: `operate_scanner(operation='scan_document', ...)`\n"
+        "2. **Detect fields**: `process_document(operation='detect_forms', source_path='...')`\n"
+        "   Returns checkboxes, text fields, radio buttons, signatures with bbox coords.\n"
+        "3. **Reconstruct**: `process_document(operation='reconstruct_form', source_path='...')`\n"
+        "   Assembles detected fields + layout analysis + OCR text into FormReconstruction JSON\n"
+        "   with mm-precise coordinates (converted from pixel bbox via scan DPI).\n\n"
+        "4. **Send to libreoffice-mcp**: Pass the JSON path to libreoffice_mcp `build_form_document`.\n"
+        "   This generates a fillable ODT with positioned fields matching the original form layout.\n\n"
+        "5. **Fill & print**: Fill in LibreOffice, then print the complete form or just your entries\n"
+        "   (entries-only overlay for printing onto the physical paper form).\n\n"
+        "The FormReconstruction JSON is a cross-repo contract. Both servers use the same Pydantic models."
+    ),
+}
+
+# get_system_status results reused for this long, keyed by (level, backend manager)
+_STATUS_TTL_SECS = 1.0
+_status_cache: dict[tuple[str, int], tuple[float, dict[str, Any]]] = {}
+
+
 def get_help_content(level: str = "basic", topic: str | None = None) -> str:
     """Provides contextual help for OCR-MCP tools and workflows.
 
     Levels: basic (quick-start), intermediate (workflow guides), advanced (backend details).
     """
-    help_data = {
-        "basic": (
-            "# OCR-MCP Help\n\n"
-            "OCR-MCP provides 14 OCR backends for extracting text from images and PDFs,\n"
-            "plus form field detection, layout analysis, and form reconstruction.\n\n"
-            "## Quick Start\n"
-            '- **OCR a document**: `process_document(source_path="/path/to/doc.png")`\n'
-            '- **List backends**: `manage_workflow(operation="list_backends")`\n'
-            '- **Check health**: `manage_workflow(operation="ocr_health_check")`\n'
-            '- **Scan**: `operate_scanner(operation="scan_document", output_path="/tmp/scan.png")`\n'
-            '- **Detect form fields**: `process_document(operation="detect_forms", source_path="form.png")`\n'
-            '- **Reconstruct form**: `process_document(operation="reconstruct_form", source_path="form.png")`\n'
-            "- **Form workflow**: reconstruct_form -> libreoffice-mcp build_form_document -> fill & print\n\n"
-            "## Common Backends\n"
-            "- **tesseract** — Fast CPU OCR, no GPU needed\n"
-            "- **easyocr** — Multi-language DL OCR with bounding boxes\n"
-            "- **olmocr-2** — Best for academic PDFs (7B VLM, needs GPU)\n"
-            "- **paddleocr-vl** — SOTA VL OCR, 109 languages\n"
-            "- **mistral-ocr** — Cloud API, no local GPU\n\n"
-            'Use `get_help(level="advanced")` for backend details and pipeline guides.'
-        ),
-        "advanced": (
-            "# OCR-MCP Advanced\n\n"
-            "## Backend Selection\n"
-            '- Auto-selection: `process_document(source_path="...", backend="auto")`\n'
-            "  uses image quality analysis to pick the best backend\n"
-            '- Manual: `process_document(source_path="...", backend="olmocr-2")`\n\n'
-            "## PDF Processing\n"
-            '- Single-image PDF: `process_document(source_path="file.pdf")`\n'
-            '- Multi-page pipeline: use `manage_workflow(operation="process_batch_intelligent")`\n'
-            '  with `workflow_type="pdf_processing"` — renders all pages via pdf2image\n'
-            "- The olmocr-2 backend has a dedicated `process_pdf()` method for arXiv papers\n\n"
-            "## Pipelines\n"
-            '- Create: `manage_workflow(operation="create_processing_pipeline", ...)`\n'
-            '- Execute: `manage_workflow(operation="execute_pipeline", ...)`\n'
-            "- Valid steps: deskew_image, enhance_image, rotate_image, crop_image,\n"
-            "  process_document, assess_ocr_quality, convert_image_format,\n"
-            "  analyze_document_layout, extract_table_data\n\n"
-            "## Model Management\n"
-            '- Free idle models: `manage_workflow(operation="manage_models")`\n'
-            "- List loaded: use backend_manager or check server logs\n\n"
-            "## Quality Assessment\n"
-            '- `process_document(operation="assess_quality")` — image readiness for OCR\n'
-            '- `process_document(operation="validate_accuracy")` — compare backends\n'
-            '- `process_document(operation="compare_backends")` — side-by-side output\n\n'
-            "## Form Reconstruction\n"
-            "The form reconstruction pipeline bridges ocr-mcp with libreoffice-mcp:\n\n"
-            "1. **Scan** the form: `operate_scanner(operation='scan_document', ...)`\n"
-            "2. **Detect fields**: `process_document(operation='detect_forms', source_path='...')`\n"
-            "   Returns checkboxes, text fields, radio buttons, signatures with bbox coords.\n"
-            "3. **Reconstruct**: `process_document(operation='reconstruct_form', source_path='...')`\n"
-            "   Assembles detected fields + layout analysis + OCR text into FormReconstruction JSON\n"
-            "   with mm-precise coordinates (converted from pixel bbox via scan DPI).\n\n"
-            "4. **Send to libreoffice-mcp**: Pass the JSON path to libreoffice_mcp `build_form_document`.\n"
-            "   This generates a fillable ODT with positioned fields matching the original form layout.\n\n"
-            "5. **Fill & print**: Fill in LibreOffice, then print the complete form or just your entries\n"
-            "   (entries-only overlay for printing onto the physical paper form).\n\n"
-            "The FormReconstruction JSON is a cross-repo contract. Both servers use the same Pydantic models."
-        ),
-    }
-    return help_data.get(level, help_data["basic"])
+    return _HELP_CONTENT.get(level, _HELP_CONTENT["basic"])
 
 
 def get_system_status(level: str = "basic", backend_manager: Any = None) -> dict[str, Any]:
-    """Returns system health and backend status."""
+    """Returns system health and backend status.
+
+    Reused for ``_STATUS_TTL_SECS`` so UIs polling status don't re-probe every backend each time.
+    Callers get their own copy, so editing a response can't change what the next caller sees.
+    """
+    key = (level, id(backend_manager))
+    now = time.monotonic()
+    cached = _status_cache.get(key)
+    if cached and now - cached[0] < _STATUS_TTL_SECS:
+        return copy.deepcopy(cached[1])
+
     status = {
         "status": "healthy",
         "backends": backend_manager.list_backends() if backend_manager else [],
     }
+    _status_cache[key] = (now, copy.deepcopy(status))
     return status
 
 
@@ -994,17 +1013,17 @@ async def handle_workflow_op(
     """
     Backend handler for workflow operations. See ocr_tools.workflow_management for MCP tool docstring.
     Note: ocr_tools exposes simplified API (workflow_name, source_dir, output_dir, pipeline_config);
-    this accepts full API. Some handlers are placeholders (monitor_batch_progress, manage_models).
+    this accepts full API.
 
     OPERATIONS:
     - process_batch_intelligent: Auto workflow per document. Requires: document_paths.
     - create_processing_pipeline: Define custom pipeline. Requires: pipeline_name, steps.
     - execute_pipeline: Run pipeline on documents. Requires: pipeline_config, input_documents.
-    - monitor_batch_progress: Batch progress (placeholder).
+    - monitor_batch_progress: Progress of a registered batch. Requires: batch_id.
     - optimize_processing: Recommended settings. Requires: document_paths.
     - ocr_health_check: Backend health.
     - list_backends: Available OCR backends.
-    - manage_models: Model memory (placeholder).
+    - manage_models: Unload models idle longer than max_idle_seconds.
 
     Args:
     - operation (str, required): Operation to perform. Must be one of OPERATIONS above.
@@ -7,6 +7,7 @@ Operations:
 - full_pipeline: OCR + chapters + EPUB in one call (requires page image paths).
 """
 
+import asyncio
 import logging
 from typing import Any, Literal
 
@@ -18,6 +19,10 @@ from .models import ToolResponse
 
 logger = logging.getLogger(__name__)
 
+# full_pipeline OCR: pages per batch, and batches in flight (matches process_batch's max_concurrent)
+_PAGE_OCR_BATCH_SIZE = 8
+_PAGE_OCR_CONCURRENCY = 4
+
 try:
     from ..services.book_assembler import assemble_epub
     from ..services.chapter_detector import detect_chapters, detect_metadata
@@ -163,18 +168,29 @@ async def _handle_full_pipeline(image_paths, backend, title, author, output_path
             success=False, operation="full_pipeline", summary="Backend manager not available in context"
         )
 
-    # OCR all pages
-    pages = []
-    for img_path in sorted(image_paths):
-        result = await bm.process_with_backend(backend, img_path, "text")
-        text = result.get("text", "")
-        pages.append(
-            {
-                "page_number": len(pages) + 1,
-                "text": text,
-                "confidence": result.get("confidence", 0.0),
-            }
+    # OCR all pages in fixed-size batches, a few batches in flight at once, results kept in page
+    # order. Batching backends (easyocr) read each batch in one call; others go page by page
+    sorted_paths = sorted(image_paths)
+    semaphore = asyncio.Semaphore(_PAGE_OCR_CONCURRENCY)
+
+    async def ocr_batch(batch_paths: list[str]) -> list[dict[str, Any]]:
+        async with semaphore:
+            return await bm.process_batch_with_backend(backend, batch_paths, "text")
+
+    batch_results = await asyncio.gather(
+        *(
+            ocr_batch(sorted_paths[i : i + _PAGE_OCR_BATCH_SIZE])
+            for i in range(0, len(sorted_paths), _PAGE_OCR_BATCH_SIZE)
         )
+    )
+    pages = [
+        {
+            "page_number": page_number,
+            "text": result.get("text", ""),
+            "confidence": result.get("confidence", 0.0),
+        }
+        for page_number, result in enumerate((r for batch in batch_results for r in batch), start=1)
+    ]
 
     if not pages:
         return ToolResponse(success=False, operation="full_pipeline", summary="OCR produced no pages")
@@ -166,6 +166,7 @@ def register_sota_tools(app, backend_manager_or_runtime, config: OCRConfig):
                     source_dir=source_path,
                     backend=backend,
                     mode=ocr_mode,
+                    max_concurrent=max_concurrent,
                     backend_manager=backend_manager,
                     config=config,
                 )
@@ -385,12 +386,13 @@ def register_sota_tools(app, backend_manager_or_runtime, config: OCRConfig):
         contrast: int = 0,
         count: int = 1,
         duplex: bool = False,
+        force_refresh: bool = False,
     ) -> ToolResponse:
         """
         Hardware control for connected Windows WIA scanners.
 
         OPERATIONS:
-        - list_scanners: Enumerate connected devices and get device_ids.
+        - list_scanners: Enumerate connected devices and get device_ids. Cached for 30s; force_refresh=True rescans.
         - scan_document: Acquire single page from flatbed. Returns ``saved_path`` for use with process_document.
         - scan_batch: Acquire multiple pages using ADF.
         - diagnostics: Test scanner connectivity and capabilities.
@@ -427,6 +429,7 @@ def register_sota_tools(app, backend_manager_or_runtime, config: OCRConfig):
                 contrast=contrast,
                 count=count,
                 duplex=duplex,
+                force_refresh=force_refresh,
             )
             return ToolResponse(
                 success=res_data.get("success", True),
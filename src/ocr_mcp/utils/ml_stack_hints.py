@@ -1,5 +1,5 @@
 """
-One-shot hints after PyYAML/bootstrap: transformers import, flash-attn for GPU VRAM.
+One-shot hints after PyYAML/bootstrap: transformers import, flash-attn for GPU VRAM, Pillow build.
 
 Does not install packages (except via separate ``OCR_AUTO_INSTALL_DEPS`` flow).
 """
@@ -15,7 +15,7 @@ _hints_emitted = False
 
 
 def emit_ml_stack_hints() -> None:
-    """Log at most once per process: GPU + missing flash-attn; transformers smoke."""
+    """Log at most once per process: GPU + missing flash-attn; transformers smoke; Pillow build."""
     global _hints_emitted
     if _hints_emitted:
         return
@@ -40,3 +40,14 @@ def emit_ml_stack_hints() -> None:
         logger.debug("transformers import OK for ML OCR backends.")
     except Exception as e:
         logger.debug("transformers not importable (install torch/transformers or uv sync): %s", e)
+
+    try:
+        import PIL
+
+        # Pillow-SIMD releases carry a ".postN" suffix (see docs/BACKEND_DEPS.md)
+        if ".post" in PIL.__version__:
+            logger.info("Pillow-SIMD %s active for image conversion/resize paths.", PIL.__version__)
+        else:
+            logger.debug("Stock Pillow %s loaded (Pillow-SIMD not installed).", PIL.__version__)
+    except Exception as e:
+        logger.debug("Pillow not importable: %s", e)
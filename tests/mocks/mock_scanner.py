@@ -6,6 +6,7 @@ to enable testing without requiring physical scanner hardware.
 """
 
 import asyncio
+from collections.abc import AsyncIterator
 from typing import Any
 
 from PIL import Image
@@ -172,25 +173,30 @@ class MockScannerManager:
         self.call_count += 1
         return self.wia_backend.scan_document(device_id, settings)
 
+    def preview_scan(self, device_id: str, dpi: int = 75) -> Image.Image | None:
+        """Mock preview scanning."""
+        return self.scan_document(device_id, {"dpi": dpi, "color_mode": "Color"})
+
     async def scan_batch(
         self, device_id: str, settings: dict[str, Any], count: int = 10, auto_process: bool = True
     ) -> list[Image.Image]:
         """Mock batch scanning."""
         self.call_count += 1
+        return [image async for image in self.iter_scan_batch(device_id, settings, count)]
 
-        images = []
-        for i in range(count):
+    async def iter_scan_batch(
+        self, device_id: str, settings: dict[str, Any], count: int = 10
+    ) -> AsyncIterator[Image.Image]:
+        """Mock streaming batch scan."""
+        for _ in range(count):
             image = self.scan_document(device_id, settings)
-            if image:
-                images.append(image)
-            else:
+            if not image:
                 break  # Stop on first failure
+            yield image
 
             # Small delay between scans
             await asyncio.sleep(0.05)
 
-        return images
-
     def get_available_backends(self) -> list[str]:
         """Mock available backends."""
         return ["wia"] if self.is_available() else []
@@ -0,0 +1,79 @@
+# MIT License
+#
+# Copyright (c) 2025 OCR-MCP Project
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+#
+#
+#
+#
+
+"""AnalysisCache memoization by file content."""
+
+import os
+
+import pytest
+
+from ocr_mcp.core.cache import AnalysisCache
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_memoize_reuses_result_until_file_changes(tmp_path):
+    cache = AnalysisCache()
+    calls = []
+
+    @cache.memoize("probe")
+    async def analyze(image_path, level="basic", backend_manager=None):
+        calls.append(level)
+        return {"success": True, "size": os.path.getsize(image_path), "level": level}
+
+    page = tmp_path / "page.png"
+    page.write_bytes(b"abc")
+
+    first = await analyze(str(page), backend_manager=object())
+    assert await analyze(str(page), backend_manager=object()) == first
+    assert len(calls) == 1
+
+    await analyze(str(page), level="full")
+    assert len(calls) == 2
+
+    page.write_bytes(b"abcdef")
+    assert (await analyze(str(page)))["size"] == 6
+    assert len(calls) == 3
+
+
+async def test_memoize_skips_failures_and_missing_files(tmp_path):
+    cache = AnalysisCache()
+    calls = []
+
+    @cache.memoize("probe")
+    async def analyze(image_path):
+        calls.append(image_path)
+        return {"success": False}
+
+    page = tmp_path / "page.png"
+    page.write_bytes(b"abc")
+    await analyze(str(page))
+    await analyze(str(page))
+    await analyze(str(tmp_path / "missing.png"))
+
+    assert len(calls) == 3
@@ -323,6 +323,52 @@ class TestBackendManager:
         assert len(available) == available_count
         assert all(n in manager.backends for n in available)
 
+    @pytest.mark.asyncio
+    async def test_warmup_initializes_lazy_backends_and_reports_only_loaded(self, config):
+        """Test that warmup runs a backend's own lazy initializer and skips backends with nothing to load."""
+        from ocr_mcp.backends.easyocr_backend import EasyOCRBackend
+
+        easyocr = EasyOCRBackend(config)
+        easyocr._available = True
+        easyocr._easyocr = Mock()
+        plain = OCRBackend("tesseract", config)
+        plain._available = True
+        manager = BackendManager(config)
+        manager.backends.update({"easyocr": easyocr, "tesseract": plain})
+
+        warmed = await manager.warmup(["easyocr", "tesseract"])
+
+        assert warmed == ["easyocr"]
+        easyocr._easyocr.Reader.assert_called_once()
+        assert easyocr._reader is easyocr._easyocr.Reader.return_value
+
+    @pytest.mark.asyncio
+    async def test_process_batch_with_backend_one_easyocr_read_per_size_bucket(self, config, tmp_path):
+        """Test that a batching backend gets one call per bucket of similar-sized pages, results in page order."""
+        from PIL import Image
+
+        from ocr_mcp.backends.easyocr_backend import EasyOCRBackend
+
+        paths = []
+        for i, size in enumerate([(600, 800), (200, 300), (600, 800)]):
+            path = tmp_path / f"page{i}.png"
+            Image.new("L", size, 255).save(path)
+            paths.append(str(path))
+
+        backend = EasyOCRBackend(config)
+        backend._available = backend._initialized = True
+        backend._reader = Mock()
+        backend._reader.readtext_batched.side_effect = lambda images, **kw: [
+            [([[0, 0]], image.rsplit("page", 1)[1], 0.9)] for image in images
+        ]
+        manager = BackendManager(config)
+        manager.backends["easyocr"] = backend
+
+        results = await manager.process_batch_with_backend("easyocr", paths)
+
+        assert [r["text"] for r in results] == ["0.png", "1.png", "2.png"]
+        assert backend._reader.readtext_batched.call_count == 2
+
 
 class TestBackendListAndStatus:
     """Test backend listing, model status, and availability tracking."""
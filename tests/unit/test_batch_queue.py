@@ -0,0 +1,120 @@
+# MIT License
+#
+# Copyright (c) 2025 OCR-MCP Project
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+#
+#
+#
+#
+
+"""AsyncBatchQueue request coalescing."""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from PIL import Image
+
+from ocr_mcp.backends.easyocr_backend import EasyOCRBackend
+from ocr_mcp.core.backend_manager import BackendManager
+from ocr_mcp.core.batch_queue import AsyncBatchQueue, group_by_size
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submits_share_one_batch():
+    calls = []
+
+    async def process(items):
+        calls.append(list(items))
+        return [item * 2 for item in items]
+
+    queue = AsyncBatchQueue(process, max_batch_size=8, max_wait_time=0.01)
+    results = await asyncio.gather(*(queue.submit(i) for i in range(3)))
+
+    assert results == [0, 2, 4]
+    assert calls == [[0, 1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_full_batch_dispatches_without_waiting():
+    calls = []
+
+    async def process(items):
+        calls.append(list(items))
+        return items
+
+    queue = AsyncBatchQueue(process, max_batch_size=2, max_wait_time=60)
+    results = await asyncio.wait_for(asyncio.gather(*(queue.submit(i) for i in range(4))), timeout=1)
+
+    assert results == [0, 1, 2, 3]
+    assert calls == [[0, 1], [2, 3]]
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_reaches_every_submitter():
+    async def process(items):
+        raise RuntimeError("model crashed")
+
+    queue = AsyncBatchQueue(process, max_wait_time=0.01)
+    results = await asyncio.gather(queue.submit("a"), queue.submit("b"), return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    with pytest.raises(RuntimeError):
+        await queue.submit("c")
+
+
+def test_group_by_size_separates_dissimilar_pages():
+    sizes = [(1000, 1400), (300, 400), (1000, 1300), (310, 400)]
+
+    assert group_by_size(sizes) == [[0, 2], [1, 3]]
+
+
+def test_group_by_size_separates_portrait_from_landscape_of_equal_area():
+    sizes = [(1000, 2000), (2000, 1000), (990, 1980)]
+
+    assert group_by_size(sizes) == [[0, 2], [1]]
+
+
+@pytest.mark.asyncio
+async def test_easyocr_requests_coalesce_into_one_batched_read(config, tmp_path):
+    paths = []
+    for i, size in enumerate([(600, 800), (600, 800), (580, 800)]):
+        path = tmp_path / f"page{i}.png"
+        Image.new("L", size, 255).save(path)
+        paths.append(str(path))
+
+    backend = EasyOCRBackend(config)
+    backend._available = backend._initialized = True
+    backend._reader = Mock()
+    backend._reader.readtext_batched.side_effect = lambda images, **kw: [
+        [([[0, 0], [600, 800]], f"text {i}", 0.9)] for i in range(len(images))
+    ]
+    manager = BackendManager(config)
+    manager.backends["easyocr"] = backend
+
+    results = await asyncio.gather(*(manager.process_with_backend("easyocr", path) for path in paths))
+
+    assert [r["text"] for r in results] == ["text 0", "text 1", "text 2"]
+    assert all(r["backend_used"] == "easyocr" for r in results)
+    backend._reader.readtext_batched.assert_called_once_with(paths, n_width=600, n_height=800)
+    # Boxes come back in each page's own frame, whatever batch it shared
+    assert results[2]["raw_results"][0]["bbox"] == [[0, 0], [580, 800]]
@@ -0,0 +1,129 @@
+# MIT License
+#
+# Copyright (c) 2025 OCR-MCP Project
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+#
+#
+#
+#
+
+"""Streaming batch results from the document processor."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from ocr_mcp.tools._processor import iter_batch_results
+
+
+def _manager(delays: dict[str, float]) -> Mock:
+    async def process_with_backend(backend_name, image_path, mode, region):
+        await asyncio.sleep(delays[image_path])
+        return {"success": True, "text": image_path, "confidence": 0.9}
+
+    manager = Mock(spec=["process_with_backend"])
+    manager.process_with_backend = AsyncMock(side_effect=process_with_backend)
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_documents_yield_in_completion_order(tmp_path):
+    slow, fast = tmp_path / "slow.png", tmp_path / "fast.png"
+    slow.write_bytes(b"")
+    fast.write_bytes(b"")
+    manager = _manager({str(slow): 0.05, str(fast): 0.0})
+
+    order = [
+        (index, result["text"])
+        async for index, result in iter_batch_results(
+            [str(slow), str(fast)], backend="tesseract", max_concurrent=2, backend_manager=manager
+        )
+    ]
+
+    assert order == [(1, str(fast)), (0, str(slow))]
+
+
+@pytest.mark.asyncio
+async def test_closing_early_stops_remaining_pages(tmp_path):
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"page{i}.png"
+        path.write_bytes(b"")
+        paths.append(str(path))
+    manager = _manager(dict.fromkeys(paths, 0.01))
+
+    stream = iter_batch_results(paths, backend="tesseract", max_concurrent=1, backend_manager=manager)
+    async for _ in stream:
+        break
+    await stream.aclose()
+
+    assert manager.process_with_backend.await_count < len(paths)
+
+
+@pytest.mark.asyncio
+async def test_rendered_pages_removed_with_their_own_directory_only(tmp_path):
+    render_dirs = []
+
+    def extract_images(file_path, **kwargs):
+        # Same-stem PDFs from different folders, each rendered into a directory of its own
+        render_dir = tmp_path / f"render{len(render_dirs)}"
+        render_dir.mkdir()
+        render_dirs.append(render_dir)
+        page = render_dir / "report_page_0000.png"
+        page.write_bytes(b"")
+        return [{"image_path": str(page), "page_number": 0, "metadata": {"render_dir": str(render_dir)}}]
+
+    manager = Mock(spec=["process_with_backend", "document_processor"])
+    manager.process_with_backend = AsyncMock(return_value={"success": True, "text": "page", "confidence": 0.9})
+    manager.document_processor = Mock(extract_images=extract_images)
+    pdfs = [str(tmp_path / "a" / "report.pdf"), str(tmp_path / "b" / "report.pdf")]
+    unrelated = tmp_path / "unrelated.png"
+    unrelated.write_bytes(b"")
+
+    results = [r async for r in iter_batch_results(pdfs, backend="tesseract", backend_manager=manager)]
+    await asyncio.sleep(0.05)
+
+    assert len(results) == 2
+    assert not any(render_dir.exists() for render_dir in render_dirs)
+    assert unrelated.exists()
+
+
+def test_shared_semaphore_survives_a_new_event_loop(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"page{i}.png"
+        path.write_bytes(b"")
+        paths.append(str(path))
+
+    async def run_batches() -> list[int]:
+        manager = _manager(dict.fromkeys(paths, 0.01))
+
+        async def run_batch() -> int:
+            stream = iter_batch_results(paths, backend="tesseract", max_concurrent=1, backend_manager=manager)
+            return len([r async for r in stream])
+
+        # Two batches contend for the shared max_concurrent=1 semaphore, binding it to this loop
+        return await asyncio.gather(run_batch(), run_batch())
+
+    assert asyncio.run(run_batches()) == [3, 3]
+    assert asyncio.run(run_batches()) == [3, 3]
@@ -0,0 +1,96 @@
+# MIT License
+#
+# Copyright (c) 2025 OCR-MCP Project
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+#
+#
+#
+#
+
+"""OpenCV-backed image helpers in tools._image."""
+
+import os
+
+import pytest
+from PIL import Image
+
+from ocr_mcp.tools import _image
+
+pytestmark = pytest.mark.skipif(not _image.OPENCV_AVAILABLE, reason="OpenCV not installed")
+
+
+@pytest.mark.asyncio
+async def test_rotate_image_quarter_turn_swaps_dimensions(tmp_path):
+    src = tmp_path / "page.png"
+    Image.new("RGB", (40, 20), "white").save(src)
+
+    result = await _image.rotate_image(str(src), 90)
+
+    assert result["success"] is True
+    with Image.open(result["target_path"]) as rotated:
+        assert rotated.size == (20, 40)
+    os.unlink(result["target_path"])
+
+
+@pytest.mark.asyncio
+async def test_deskew_image_leaves_blank_page_alone(tmp_path):
+    src = tmp_path / "blank.png"
+    Image.new("L", (64, 64), 255).save(src)
+
+    result = await _image.deskew_image(str(src))
+
+    assert result["success"] is True
+    assert result["angle"] == 0.0
+    assert result["target_path"] == str(src)
+
+
+@pytest.mark.asyncio
+async def test_deskew_image_missing_file():
+    result = await _image.deskew_image("/nonexistent/scan.png")
+    assert result["success"] is False
+
+
+def test_read_cv_image_redecodes_after_file_changes(tmp_path):
+    src = tmp_path / "page.png"
+    Image.new("L", (10, 10), 0).save(src)
+    assert _image._read_cv_image(str(src)).shape == (10, 10)
+
+    Image.new("L", (30, 10), 0).save(src)
+    os.utime(src, ns=(0, os.stat(src).st_mtime_ns + 1_000_000))
+
+    assert _image._read_cv_image(str(src)).shape == (10, 30)
+
+
+@pytest.mark.asyncio
+async def test_preprocess_deskew_with_autocrop_crops_to_content(tmp_path):
+    src = tmp_path / "page.png"
+    # Off-white paper, as a scanner delivers it, with faint speckle that isn't content
+    img = Image.new("L", (100, 100), 245)
+    img.putpixel((5, 90), 230)
+    img.paste(0, (20, 32, 60, 52))
+    img.save(src)
+
+    result = await _image.preprocess_image(str(src), denoise=False, deskew=True, autocrop=True)
+
+    assert result["success"] is True
+    assert (result["processed_info"]["width"], result["processed_info"]["height"]) == (40, 20)
+    os.unlink(result["target_path"])
@@ -0,0 +1,68 @@
+# MIT License
+#
+# Copyright (c) 2025 OCR-MCP Project
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+#
+#
+#
+#
+
+"""Regex helpers behind extract_document_metadata."""
+
+from ocr_mcp.tools._analysis import (
+    _extract_addresses,
+    _extract_dates,
+    _extract_names,
+    _extract_numbers_and_amounts,
+)
+
+SAMPLE_TEXT = (
+    "Invoice INV-1234 issued 01/02/2024 and due March 5, 2024.\n"
+    "Bill to: John Smith, 42 Baker Street, London\n"
+    "The total is 120.50 USD (reference 987654).\n"
+)
+
+
+def test_extract_dates_finds_all_formats():
+    dates = _extract_dates(SAMPLE_TEXT + "Signed 2024-03-07 and 7 April 2024.")
+    assert set(dates) == {"01/02/2024", "March 5, 2024", "2024-03-07", "7 April 2024"}
+
+
+def test_extract_names_skips_common_words():
+    names = _extract_names(SAMPLE_TEXT)
+    assert "John" in names
+    assert "Smith" in names
+    assert "The" not in names
+
+
+def test_extract_numbers_and_amounts():
+    data = _extract_numbers_and_amounts(SAMPLE_TEXT)
+    assert data["document_numbers"] == ["INV-1234"]
+    assert data["amounts"] == ["120.50 USD"]
+    assert "987654" in data["numbers"]
+    # Digits already claimed by a document number or amount are not repeated as plain numbers
+    assert "1234" not in data["numbers"]
+    assert "120" not in data["numbers"]
+
+
+def test_extract_addresses():
+    assert _extract_addresses(SAMPLE_TEXT) == ["Bill to: John Smith, 42 Baker Street, London"]
@@ -0,0 +1,146 @@
+# MIT License
+#
+# Copyright (c) 2025 OCR-MCP Project
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+#
+#
+#
+#
+
+"""Scanner portmanteau dispatch and discovery caching."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from ocr_mcp.tools import _scanner
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def backend_manager():
+    _scanner._scanner_list_cache.clear()
+    _scanner._properties_cache.clear()
+    _scanner._preview_cache.clear()
+    _scanner._applied_settings.clear()
+    scanner_manager = Mock()
+    scanner_manager.is_available.return_value = True
+    scanner_manager.discover_scanners.return_value = [SimpleNamespace(device_id="wia:1", device_type="Flatbed")]
+    scanner_manager.get_backend_status.return_value = {"wia": {"available": True}}
+    return SimpleNamespace(scanner_manager=scanner_manager)
+
+
+async def test_list_scanners_reuses_recent_discovery(backend_manager):
+    first = await _scanner.handle_scanner_op("list_scanners", backend_manager=backend_manager)
+    await _scanner.handle_scanner_op("scanner_properties", backend_manager=backend_manager)
+    second = await _scanner.handle_scanner_op("list_scanners", backend_manager=backend_manager)
+
+    assert first == second
+    assert backend_manager.scanner_manager.discover_scanners.call_count == 1
+
+
+async def test_force_refresh_and_failed_scan_rediscover(backend_manager):
+    await _scanner.handle_scanner_op("list_scanners", backend_manager=backend_manager)
+    await _scanner.handle_scanner_op("list_scanners", backend_manager=backend_manager, force_refresh=True)
+    assert backend_manager.scanner_manager.discover_scanners.call_count == 2
+
+    backend_manager.scanner_manager.scan_document.return_value = None
+    result = await _scanner.handle_scanner_op("scan_document", backend_manager=backend_manager)
+    await _scanner.handle_scanner_op("list_scanners", backend_manager=backend_manager)
+
+    assert result["success"] is False
+    assert backend_manager.scanner_manager.discover_scanners.call_count == 3
+
+
+async def test_scanner_properties_cached_per_device(backend_manager):
+    backend_manager.scanner_manager.get_scanner_properties.return_value = SimpleNamespace(supported_resolutions=[300])
+
+    first = await _scanner.handle_scanner_op("scanner_properties", device_id="wia:1", backend_manager=backend_manager)
+    first["results"]["properties"]["supported_resolutions"] = []
+    second = await _scanner.handle_scanner_op("scanner_properties", device_id="wia:1", backend_manager=backend_manager)
+    await _scanner.handle_scanner_op("scanner_properties", device_id="wia:2", backend_manager=backend_manager)
+
+    assert second["results"]["properties"] == {"supported_resolutions": [300]}
+    assert backend_manager.scanner_manager.get_scanner_properties.call_count == 2
+
+
+async def test_scan_settings_normalized_and_validated(backend_manager):
+    await _scanner.handle_scanner_op(
+        "configure_scan", device_id="wia:1", color_mode="grayscale", backend_manager=backend_manager
+    )
+    _, settings = backend_manager.scanner_manager.configure_scan.call_args.args
+    assert settings["color_mode"] == "Grayscale"
+
+    result = await _scanner.handle_scanner_op(
+        "scan_document", device_id="wia:1", resolution=0, brightness=5000, backend_manager=backend_manager
+    )
+    assert result["error_code"] == "PARAMETERS_INVALID"
+    assert len(result["details"]["invalid_settings"]) == 2
+    backend_manager.scanner_manager.scan_document.assert_not_called()
+
+
+async def test_concurrent_previews_share_one_scan(backend_manager):
+    def slow_preview(device_id, dpi):
+        time.sleep(0.05)
+        return SimpleNamespace()
+
+    backend_manager.scanner_manager.preview_scan.side_effect = slow_preview
+
+    results = await asyncio.gather(
+        *(
+            _scanner.handle_scanner_op("preview_scan", device_id="wia:1", backend_manager=backend_manager)
+            for _ in range(3)
+        )
+    )
+
+    assert all(result["success"] for result in results)
+    assert backend_manager.scanner_manager.preview_scan.call_count == 1
+    assert not _scanner._preview_inflight
+
+
+async def test_recent_preview_served_until_reconfigured(backend_manager):
+    first = await _scanner.handle_scanner_op("preview_scan", device_id="wia:1", backend_manager=backend_manager)
+    second = await _scanner.handle_scanner_op("preview_scan", device_id="wia:1", backend_manager=backend_manager)
+    assert (first["results"]["cache_hit"], second["results"]["cache_hit"]) == (False, True)
+    assert backend_manager.scanner_manager.preview_scan.call_count == 1
+
+    await _scanner.handle_scanner_op("configure_scan", device_id="wia:1", backend_manager=backend_manager)
+    third = await _scanner.handle_scanner_op("preview_scan", device_id="wia:1", backend_manager=backend_manager)
+    assert third["results"]["cache_hit"] is False
+    assert backend_manager.scanner_manager.preview_scan.call_count == 2
+
+
+async def test_repeat_configure_skips_driver_until_a_scan(backend_manager):
+    backend_manager.scanner_manager.configure_scan.return_value = True
+
+    first = await _scanner.handle_scanner_op("configure_scan", device_id="wia:1", backend_manager=backend_manager)
+    second = await _scanner.handle_scanner_op("configure_scan", device_id="wia:1", backend_manager=backend_manager)
+    assert (first["results"]["no_change"], second["results"]["no_change"]) == (False, True)
+    assert backend_manager.scanner_manager.configure_scan.call_count == 1
+
+    await _scanner.handle_scanner_op("scan_document", device_id="wia:1", backend_manager=backend_manager)
+    await _scanner.handle_scanner_op("configure_scan", device_id="wia:1", backend_manager=backend_manager)
+    assert backend_manager.scanner_manager.configure_scan.call_count == 2